@@ -7,16 +7,14 @@ import textwrap
 
 import click
 from atproto import Client
-from rich.console import Console
 
 from atpcli.config import Config
+from atpcli.console import console
 from atpcli.constants import DEFAULT_PDS_URL
 from atpcli.display.bsky import display_feeds, display_post
 from atpcli.session import create_client_with_session_refresh
 from atpcli.spice import spice
 
-console = Console()
-
 atpcli_HEADER = r"""
                   _  _
   __ _ _ __  ____| (_)
@@ -62,7 +60,7 @@ def login(pds_url: str, handle: str, password: str):
     """Login to an AT Protocol PDS and save session."""
     try:
         client = Client(base_url=pds_url)
-        console.print(f"[blue]Logging in to {pds_url} as {handle}...[/blue]")
+        console().print(f"[blue]Logging in to {pds_url} as {handle}...[/blue]")
         profile = client.login(handle, password)
 
         # Get the session string from the client
@@ -72,10 +70,10 @@ def login(pds_url: str, handle: str, password: str):
         config = Config()
         config.save_session(handle, session_string, pds_url)
 
-        console.print(f"[green]✓ Successfully logged in as {profile.display_name or handle}[/green]")
-        console.print(f"[dim]Session saved to {config.config_file}[/dim]")
+        console().print(f"[green]✓ Successfully logged in as {profile.display_name or handle}[/green]")
+        console().print(f"[dim]Session saved to {config.config_file}[/dim]")
     except Exception as e:
-        console.print(f"[red]✗ Login failed: {e}[/red]")
+        console().print(f"[red]✗ Login failed: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -88,11 +86,11 @@ def timeline(limit: int, page: int):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     try:
-        console.print(f"[blue]Loading timeline for {handle}...[/blue]")
+        console().print(f"[blue]Loading timeline for {handle}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -103,13 +101,15 @@ def timeline(limit: int, page: int):
         cursor = None
         if page > 5:
             warning_msg = f"[yellow]⚠ Loading page {page} requires {page} API calls. This may take a moment...[/yellow]"
-            console.print(warning_msg)
+            console().print(warning_msg)
 
         for i in range(1, page):
             response = client.get_timeline(limit=limit, cursor=cursor)
             cursor = response.cursor
             if not cursor:
-                console.print(f"[yellow]⚠ Page {page} does not exist. Showing last available page (page {i}).[/yellow]")
+                console().print(
+                    f"[yellow]⚠ Page {page} does not exist. Showing last available page (page {i}).[/yellow]"
+                )
                 page = i
                 break
 
@@ -118,12 +118,14 @@ def timeline(limit: int, page: int):
 
         # Reverse the feed so latest posts appear at the bottom
         # This allows users to scroll up to read
+        # Each post is printed as soon as it is built, so a page streams out while
+        # reply parents are still being fetched
         reversed_feed = list(reversed(timeline_response.feed))
 
         for feed_view in reversed_feed:
             post = feed_view.post
             table = display_post(post, client)
-            console.print(table)
+            console().print(table)
 
         # Show pagination info
         post_count = len(timeline_response.feed)
@@ -132,10 +134,10 @@ def timeline(limit: int, page: int):
         if timeline_response.cursor:
             page_info += f" - Use --p {page + 1} for next page"
         page_info += "[/dim]"
-        console.print(f"\n{page_info}")
+        console().print(f"\n{page_info}")
 
     except Exception as e:
-        console.print(f"[red]✗ Failed to load timeline: {e}[/red]")
+        console().print(f"[red]✗ Failed to load timeline: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -154,7 +156,7 @@ def get_message_from_editor():
                 continue
 
     if not editor:
-        console.print("[red]✗ No editor found. Please set the EDITOR environment variable or install vim/vi.[/red]")
+        console().print("[red]✗ No editor found. Please set the EDITOR environment variable or install vim/vi.[/red]")
         raise SystemExit(1)
 
     # Create a temporary file
@@ -181,7 +183,7 @@ def get_message_from_editor():
         message = "".join(message_lines).strip()
 
         if not message:
-            console.print("[yellow]⚠ Empty message. Post cancelled.[/yellow]")
+            console().print("[yellow]⚠ Empty message. Post cancelled.[/yellow]")
             raise SystemExit(0)
 
         return message
@@ -201,7 +203,7 @@ def post(message: str):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     # If no message provided, open editor
@@ -209,7 +211,7 @@ def post(message: str):
         message = get_message_from_editor()
 
     try:
-        console.print(f"[blue]Posting as {handle}...[/blue]")
+        console().print(f"[blue]Posting as {handle}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -221,11 +223,11 @@ def post(message: str):
         post_id = response.uri.split("/")[-1]
         web_url = f"https://bsky.app/profile/{handle}/post/{post_id}"
 
-        console.print("[green]✓ Post created successfully![/green]")
-        console.print(f"[blue]View your post at: [link={web_url}]{web_url}[/link][/blue]")
+        console().print("[green]✓ Post created successfully![/green]")
+        console().print(f"[blue]View your post at: [link={web_url}]{web_url}[/link][/blue]")
 
     except Exception as e:
-        console.print(f"[red]✗ Failed to post: {e}[/red]")
+        console().print(f"[red]✗ Failed to post: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -237,11 +239,11 @@ def feeds(output_format: str):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     try:
-        console.print(f"[blue]Loading saved feeds for {handle}...[/blue]")
+        console().print(f"[blue]Loading saved feeds for {handle}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -266,14 +268,14 @@ def feeds(output_format: str):
                 break
 
         if not saved_feeds:
-            console.print("[yellow]No saved feeds found.[/yellow]")
-            console.print("[dim]Save feeds in the Bluesky app to see them here.[/dim]")
+            console().print("[yellow]No saved feeds found.[/yellow]")
+            console().print("[dim]Save feeds in the Bluesky app to see them here.[/dim]")
             return
 
         # Output URI-only format
         if output_format == "uri":
             for feed_uri in saved_feeds:
-                console.print(feed_uri)
+                console().print(feed_uri)
             return
 
         # Fetch detailed feed information for table format
@@ -294,13 +296,13 @@ def feeds(output_format: str):
 
         # Display feeds using display function
         tables = display_feeds(feed_details)
-        console.print(f"\n[bold]Saved Feeds ({len(tables)})[/bold]\n")
+        console().print(f"\n[bold]Saved Feeds ({len(tables)})[/bold]\n")
         for table in tables:
-            console.print(table)
-        console.print("\n[dim]Use 'atpcli bsky feed <uri>' to view posts from a specific feed.[/dim]")
+            console().print(table)
+        console().print("\n[dim]Use 'atpcli bsky feed <uri>' to view posts from a specific feed.[/dim]")
 
     except Exception as e:
-        console.print(f"[red]✗ Failed to load feeds: {e}[/red]")
+        console().print(f"[red]✗ Failed to load feeds: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -314,11 +316,11 @@ def feed(feed_uri: str, limit: int, page: int):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     try:
-        console.print(f"[blue]Loading feed {feed_uri}...[/blue]")
+        console().print(f"[blue]Loading feed {feed_uri}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -327,13 +329,15 @@ def feed(feed_uri: str, limit: int, page: int):
         cursor = None
         if page > 5:
             warning_msg = f"[yellow]⚠ Loading page {page} requires {page} API calls. This may take a moment...[/yellow]"
-            console.print(warning_msg)
+            console().print(warning_msg)
 
         for i in range(1, page):
             response = client.app.bsky.feed.get_feed({"feed": feed_uri, "limit": limit, "cursor": cursor})
             cursor = response.cursor
             if not cursor:
-                console.print(f"[yellow]⚠ Page {page} does not exist. Showing last available page (page {i}).[/yellow]")
+                console().print(
+                    f"[yellow]⚠ Page {page} does not exist. Showing last available page (page {i}).[/yellow]"
+                )
                 page = i
                 break
 
@@ -341,16 +345,18 @@ def feed(feed_uri: str, limit: int, page: int):
         feed_response = client.app.bsky.feed.get_feed({"feed": feed_uri, "limit": limit, "cursor": cursor})
 
         if not feed_response.feed:
-            console.print("[yellow]This feed has no posts.[/yellow]")
+            console().print("[yellow]This feed has no posts.[/yellow]")
             return
 
         # Reverse the feed so latest posts appear at the bottom (same as timeline)
+        # Each post is printed as soon as it is built, so a page streams out while
+        # reply parents are still being fetched
         reversed_feed = list(reversed(feed_response.feed))
 
         for feed_view in reversed_feed:
             post = feed_view.post
             table = display_post(post, client)
-            console.print(table)
+            console().print(table)
 
         # Show pagination info (same as timeline)
         post_count = len(feed_response.feed)
@@ -359,10 +365,10 @@ def feed(feed_uri: str, limit: int, page: int):
         if feed_response.cursor:
             page_info += f" - Use --p {page + 1} for next page"
         page_info += "[/dim]"
-        console.print(f"\n{page_info}")
+        console().print(f"\n{page_info}")
 
     except Exception as e:
-        console.print(f"[red]✗ Failed to load feed: {e}[/red]")
+        console().print(f"[red]✗ Failed to load feed: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -0,0 +1,19 @@
+"""Shared Rich console for atpcli."""
+
+from typing import Optional
+
+from rich.console import Console
+
+_console: Optional[Console] = None
+
+
+def console() -> Console:
+    """Return the shared console, creating it on first use.
+
+    Creating a Console probes the terminal, so it is deferred until something
+    is actually printed. This keeps `atpcli --help` and shell completion fast.
+    """
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
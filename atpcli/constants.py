@@ -6,3 +6,5 @@ DEFAULT_PDS_URL = "https://bsky.social"
 # Spice constants
 SPICE_COLLECTION_NAME = "tools.spice.note"
 SPICE_MAX_TEXT_LENGTH = 256
+# com.atproto.repo.applyWrites accepts at most 200 writes per request
+SPICE_BULK_BATCH_SIZE = 200
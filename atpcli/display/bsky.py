@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from typing import Any, List, Optional
 
 from atproto_client.models.app.bsky.embed.images import View as ImagesView
@@ -7,10 +8,66 @@ from atproto_client.models.app.bsky.embed.record_with_media import View as Recor
 from atproto_client.models.app.bsky.feed.defs import PostView
 from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
 from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
+from rich.style import Style
 from rich.table import Table
-from rich.text import Text
+from rich.text import Span, Text
+
+# Pattern to match URLs with or without protocol, used when a post has no facets.
+# Matches:
+# 1. URLs starting with http:// or https://
+# 2. Domain-like patterns (e.g., github.com/user/repo, example.com, x.com)
+# The pattern looks for:
+# - Optional protocol (https?://)
+# - Domain name: alphanumeric segments with hyphens (but not at start/end) separated by dots
+# - TLD with at least 2 letters
+# - Optional path, query, and fragment
+# Matches may not start inside a run of domain labels: not straight after a letter or
+# digit, nor after a dot or hyphen that follows one. Without that guard a long dotted
+# run with no TLD (e.g. "a.a.a.a...") is rescanned from every position, which is
+# quadratic in the length of the post. Punctuation runs such as "..." or "--" before a
+# domain still allow a match.
+_URL_RE = re.compile(
+    r'(?<![a-zA-Z0-9])(?<![a-zA-Z0-9][.-])(?:https?://)?(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}(?:[^\s<>"{}|\\^`\[\]]*)?'
+)
+
+# Every URL match contains a dot followed by the first two letters of its TLD. Searching
+# for that literal anchor is far cheaper than running _URL_RE, and most posts have none.
+_URL_HINT_RE = re.compile(r"\.[a-zA-Z]{2}")
+
+# Embed views and facet features are concrete atproto models that are never subclassed,
+# so they are dispatched on exact type. That skips pydantic's isinstance hook, which
+# runs for every post in a feed.
+_QUOTE_EMBED_TYPES = frozenset({RecordView, RecordWithMediaView})
+
+# Title badge for each embed type; this table is the only place embeds map to badges.
+# Quote embeds outrank images, so a record with media gets the quote badge even when
+# its media is an image.
+_EMBED_BADGES = {**dict.fromkeys(_QUOTE_EMBED_TYPES, "🔁 "), ImagesView: "📷 "}
+
+# Title markup for display_post, filled in with a single format call per post
+_POST_TITLE = "[link={url}]{badge}{display_name} (@{handle})[/link]"
+
+# Shared by every feed URI row, so it's parsed once rather than per feed
+_FEED_URI_STYLE = Style(dim=True)
+
+
+@lru_cache(maxsize=1024)
+def _link_style(url: str) -> Style:
+    """Return a shared link Style for a URL.
+
+    The same links recur across a feed (quoted threads, shared articles), so each
+    Style is built once. Reusing it also gives repeated links the same hyperlink id.
 
+    Args:
+        url: The link target
+
+    Returns:
+        Rich Style linking to the URL
+    """
+    return Style(link=url)
 
+
+@lru_cache(maxsize=4096)
 def _at_uri_to_web_url(uri: str, handle: str) -> str:
     """Convert AT protocol URI to Bluesky web URL.
 
@@ -23,150 +80,103 @@ def _at_uri_to_web_url(uri: str, handle: str) -> str:
     """
     # Extract post ID from AT URI
     # Format: at://did:plc:xxx/app.bsky.feed.post/yyy
-    parts = uri.split("/")
-    if len(parts) >= 5 and parts[3] == "app.bsky.feed.post":
-        post_id = parts[4]
+    rest, _, post_id = uri.rpartition("/")
+    repo, _, collection = rest.rpartition("/")
+    if collection == "app.bsky.feed.post" and repo.startswith("at://") and post_id:
         return f"https://bsky.app/profile/{handle}/post/{post_id}"
     return uri
 
 
-def _render_text_with_links(text: str, facets: Optional[List[FacetMain]] = None) -> Text:
-    """Render text with clickable links.
+def _render_text_from_facets(text: str, facets: List[FacetMain]) -> Text:
+    """Render text with clickable links taken from the post's link facets.
 
     Args:
         text: The text to render
-        facets: Optional list of facets from the post record (for proper link detection)
+        facets: List of facets from the post record
 
     Returns:
         Rich Text object with clickable links
     """
-    rich_text = Text()
-
-    # If we have facets, use them for accurate link detection
-    # Facets use byte indices, so we need to encode/decode properly
-    if facets:
-        # Extract link facets and sort by byte position
-        link_facets = []
-        for facet in facets:
-            for feature in facet.features:
-                if isinstance(feature, LinkFacet):
-                    # ByteSlice uses byte offsets, not character offsets
-                    link_facets.append(
-                        {"byte_start": facet.index.byte_start, "byte_end": facet.index.byte_end, "uri": feature.uri}
-                    )
-
-        # Sort by byte position
-        link_facets.sort(key=lambda x: x["byte_start"])
-
-        # Convert text to bytes for proper indexing
-        text_bytes = text.encode("utf-8")
-        last_byte_end = 0
-
-        for link_facet in link_facets:
-            byte_start = link_facet["byte_start"]
-            byte_end = link_facet["byte_end"]
-            uri = link_facet["uri"]
-
-            # Add text before the link
-            if byte_start > last_byte_end:
-                before_text = text_bytes[last_byte_end:byte_start].decode("utf-8")
-                rich_text.append(before_text)
-
-            # Add the link
-            link_text = text_bytes[byte_start:byte_end].decode("utf-8")
-            rich_text.append(link_text, style=f"link {uri}")
-            last_byte_end = byte_end
-
-        # Add any remaining text
-        if last_byte_end < len(text_bytes):
-            remaining_text = text_bytes[last_byte_end:].decode("utf-8")
-            rich_text.append(remaining_text)
-
-        return rich_text
-
-    # Fallback: use regex pattern matching if no facets available
-    # Pattern to match URLs with or without protocol.
-    # Matches:
-    # 1. URLs starting with http:// or https://
-    # 2. Domain-like patterns (e.g., github.com/user/repo, example.com, x.com)
-    # The pattern looks for:
-    # - Optional protocol (https?://)
-    # - Domain name: alphanumeric segments with hyphens (but not at start/end) separated by dots
-    # - TLD with at least 2 letters
-    # - Optional path, query, and fragment
-    url_pattern = (
-        r'(?:https?://)?(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z]{2,}(?:[^\s<>"{}|\\^`\[\]]*)?'
-    )
-
-    last_end = 0
-
-    for match in re.finditer(url_pattern, text):
-        matched_text = match.group()
-
-        # Add text before the URL
-        if match.start() > last_end:
-            rich_text.append(text[last_end : match.start()])
-
-        # Add the URL as a clickable link
-        # If the URL doesn't have a protocol, add https://
-        display_url = matched_text
-        link_url = matched_text if matched_text.startswith(("http://", "https://")) else f"https://{matched_text}"
-
-        rich_text.append(display_url, style=f"link {link_url}")
-        last_end = match.end()
-
-    # Add any remaining text
-    if last_end < len(text):
-        rich_text.append(text[last_end:])
+    # Extract link facets as (byte_start, byte_end, uri)
+    # ByteSlice uses byte offsets, not character offsets
+    link_facets = [
+        (facet.index.byte_start, facet.index.byte_end, feature.uri)
+        for facet in facets
+        for feature in facet.features
+        if type(feature) is LinkFacet
+    ]
+
+    # Mention- or tag-only facets have nothing to link, so skip the byte round trip
+    if not link_facets:
+        return Text(text)
+
+    # Sort by byte position
+    link_facets.sort()
+
+    # The rendered text is always the original text, so build it in one go and only
+    # work out where each link span sits. Facets use byte offsets. In ASCII text every
+    # character is one byte, so they are already character offsets; otherwise each
+    # segment is decoded to measure it. Slices of a memoryview share the buffer, so
+    # each segment is decoded straight from it without a bytes copy.
+    is_ascii = text.isascii()
+    text_bytes = None if is_ascii else memoryview(text.encode("utf-8"))
+    text_length = len(text) if is_ascii else len(text_bytes)
+    spans = []
+    char_pos = 0
+    last_byte_end = 0
+
+    for byte_start, byte_end, uri in link_facets:
+        # Clamp the end to the text, then drop facets that are empty, inverted or lie
+        # past the end, which would otherwise give backwards spans Rich cannot render.
+        # Facets are sorted, so one that starts before the previous link ends overlaps
+        # it. Keep the earlier link rather than styling the shared text twice.
+        byte_end = min(byte_end, text_length)
+        if byte_end <= byte_start or byte_start < last_byte_end:
+            continue
+
+        if is_ascii:
+            spans.append(Span(byte_start, byte_end, _link_style(uri)))
+        else:
+            # Skip over the text before the link, then span the link itself
+            char_pos += len(str(text_bytes[last_byte_end:byte_start], "utf-8"))
+            link_length = len(str(text_bytes[byte_start:byte_end], "utf-8"))
+            spans.append(Span(char_pos, char_pos + link_length, _link_style(uri)))
+            char_pos += link_length
+        last_byte_end = byte_end
 
-    return rich_text
+    return Text(text, spans=spans)
 
 
-def _has_image(post: PostView) -> bool:
-    """Check if a post has an image embed.
+def _render_text_with_links(text: str, facets: Optional[List[FacetMain]] = None) -> Text:
+    """Render text with clickable links.
 
     Args:
-        post: The post to check
+        text: The text to render
+        facets: Optional list of facets from the post record (for proper link detection)
 
     Returns:
-        True if the post has an image embed, False otherwise
+        Rich Text object with clickable links
     """
-    if not hasattr(post, "embed") or post.embed is None:
-        return False
-
-    # Check if it's an images embed directly
-    if isinstance(post.embed, ImagesView):
-        return True
-
-    # Check if it's a record with media (quote post with images)
-    if isinstance(post.embed, RecordWithMediaView):
-        if hasattr(post.embed, "media") and isinstance(post.embed.media, ImagesView):
-            return True
-
-    return False
-
-
-def _is_repost_or_quote(post: PostView) -> bool:
-    """Check if a post is a repost or quote post.
-
-    Args:
-        post: The post to check
+    # Facets are authoritative when present, so the URL regex never runs for them
+    if facets:
+        return _render_text_from_facets(text, facets)
 
-    Returns:
-        True if the post is a repost or quote (has a record embed), False otherwise
-    """
-    if not hasattr(post, "embed") or post.embed is None:
-        return False
+    # Skip the full URL scan when the text cannot contain a match. Every match has a
+    # dot, and a plain substring check rules out dot-free posts before any regex runs.
+    if "." not in text or not _URL_HINT_RE.search(text):
+        return Text(text)
 
-    # Check if it's a record embed (quote post)
-    if isinstance(post.embed, RecordView):
-        return True
+    # Fallback: use regex pattern matching if no facets available
+    # Links are displayed as written, so only the spans need building
+    spans = []
+    for match in _URL_RE.finditer(text):
+        matched_text = match.group()
 
-    # Check if it's a record with media (quote post with images)
-    if isinstance(post.embed, RecordWithMediaView):
-        return True
+        # If the URL doesn't have a protocol, add https://
+        link_url = matched_text if matched_text.startswith(("http://", "https://")) else f"https://{matched_text}"
+        spans.append(Span(match.start(), match.end(), _link_style(link_url)))
 
-    return False
+    return Text(text, spans=spans)
 
 
 def _is_reply(post: PostView) -> bool:
@@ -217,14 +227,10 @@ def _get_embedded_post(post: PostView, client=None) -> Optional[Any]:
             # If fetching fails, just skip showing the parent
             pass
 
-    # Check for repost/quote embed
-    if hasattr(post, "embed") and post.embed is not None:
-        if isinstance(post.embed, RecordView):
-            # Direct record embed (quote post)
-            return getattr(post.embed, "record", None)
-        elif isinstance(post.embed, RecordWithMediaView):
-            # Record with media (quote post with images)
-            return getattr(post.embed, "record", None)
+    # Check for repost/quote embed (direct record embed, or record with media)
+    embed = getattr(post, "embed", None)
+    if type(embed) in _QUOTE_EMBED_TYPES:
+        return getattr(embed, "record", None)
 
     return None
 
@@ -306,22 +312,23 @@ def display_post(post: PostView, client=None) -> Table:
     Returns:
         Rich Table with the formatted post
     """
-    # Convert AT URI to web URL
-    web_url = _at_uri_to_web_url(post.uri, post.author.handle)
-
-    # Create clickable title
-    title = f"{post.author.display_name} (@{post.author.handle})"
+    author = post.author
 
     # Add appropriate emoji indicator
-    # Priority: reply > repost/quote > image
+    # Priority: reply > repost/quote > image. Only replies depend on the record; the
+    # other badges follow from the embed type alone.
     if _is_reply(post):
-        title = f"⤴️ {title}"
-    elif _is_repost_or_quote(post):
-        title = f"🔁 {title}"
-    elif _has_image(post):
-        title = f"📷 {title}"
-
-    clickable_title = f"[link={web_url}]{title}[/link]"
+        badge = "⤴️ "
+    else:
+        badge = _EMBED_BADGES.get(type(getattr(post, "embed", None)), "")
+
+    # Create clickable title linking to the post on the web
+    clickable_title = _POST_TITLE.format(
+        url=_at_uri_to_web_url(post.uri, author.handle),
+        badge=badge,
+        display_name=author.display_name,
+        handle=author.handle,
+    )
 
     table = Table(title=clickable_title, show_header=True, expand=True)
     # Use overflow="fold" to wrap text instead of truncating with ellipsis
@@ -346,6 +353,25 @@ def display_post(post: PostView, client=None) -> Table:
     return table
 
 
+def _display_feed_details(feed: dict) -> Table:
+    """Display a single feed as a table.
+
+    Args:
+        feed: Dictionary with 'name', 'uri', and 'description' keys
+
+    Returns:
+        Rich Table with the feed's description and URI
+    """
+    table = Table(title=feed["name"], show_header=False, expand=True)
+    table.add_column("Content", style="white", overflow="fold")
+
+    if feed["description"]:
+        table.add_row(feed["description"])
+
+    table.add_row(Text(feed["uri"], style=_FEED_URI_STYLE))
+    return table
+
+
 def display_feeds(feed_details: List[dict]) -> List[Table]:
     """Display a list of feeds as individual tables.
 
@@ -355,18 +381,7 @@ def display_feeds(feed_details: List[dict]) -> List[Table]:
     Returns:
         List of Rich Tables, one per feed
     """
-    tables = []
-    for feed in feed_details:
-        table = Table(title=feed["name"], show_header=False, expand=True)
-        table.add_column("Content", style="white", overflow="fold")
-
-        if feed["description"]:
-            table.add_row(feed["description"])
-
-        table.add_row(Text(feed["uri"], style="dim"))
-        tables.append(table)
-
-    return tables
+    return [_display_feed_details(feed) for feed in feed_details]
 
 
 def get_profile_display(client, did: str, profile_cache: dict) -> str:
@@ -1,12 +1,16 @@
 """Pydantic models for Spice."""
 
+import re
 from datetime import datetime
-from urllib.parse import urlparse
 
 from pydantic import BaseModel, Field, field_validator
 
 from atpcli.constants import SPICE_COLLECTION_NAME, SPICE_MAX_TEXT_LENGTH
 
+# Scheme followed by a non-empty host, e.g. https://example.com; used with .match,
+# so it is anchored at the start. The host ends at the first /, ? or #.
+_URL_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9+.\-]*://[^/?#\s]+")
+
 
 class SpiceNote(BaseModel):
     """Model for a Spice note record."""
@@ -19,8 +23,7 @@ class SpiceNote(BaseModel):
     @classmethod
     def validate_url(cls, v: str) -> str:
         """Validate that URL has scheme and host."""
-        parsed = urlparse(v)
-        if not parsed.scheme or not parsed.netloc:
+        if not _URL_RE.match(v):
             raise ValueError("URL must include scheme and host (e.g., https://example.com)")
         return v
 
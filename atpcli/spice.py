@@ -1,19 +1,23 @@
 """Spice commands for atpcli."""
 
+import json
 from datetime import datetime, timezone
 
 import click
 from atproto.exceptions import AtProtocolError
 from pydantic import ValidationError
-from rich.console import Console
+from rich.console import Group
+from rich.markup import escape
 
 from atpcli.config import Config
-from atpcli.constants import SPICE_COLLECTION_NAME, SPICE_MAX_TEXT_LENGTH
+from atpcli.console import console
+from atpcli.constants import SPICE_BULK_BATCH_SIZE, SPICE_COLLECTION_NAME, SPICE_MAX_TEXT_LENGTH
 from atpcli.display.spice import display_spice_note
 from atpcli.models import SpiceNote
 from atpcli.session import create_client_with_session_refresh
 
-console = Console()
+# Fields shared by every create operation sent to applyWrites
+_CREATE_WRITE = {"$type": "com.atproto.repo.applyWrites#create", "collection": SPICE_COLLECTION_NAME}
 
 
 def parse_at_uri(at_uri: str) -> tuple[str, str, str]:
@@ -31,8 +35,9 @@ def parse_at_uri(at_uri: str) -> tuple[str, str, str]:
     if not at_uri.startswith("at://"):
         raise ValueError(f"AT URI must start with 'at://': {at_uri}")
 
-    parts = at_uri.replace("at://", "").split("/")
-    if len(parts) != 3:
+    # Slice off only the leading scheme; every part must be non-empty
+    parts = at_uri[5:].split("/")
+    if len(parts) != 3 or not all(parts):
         raise ValueError(f"Invalid AT URI format (expected at://did/collection/rkey): {at_uri}")
 
     return parts[0], parts[1], parts[2]
@@ -63,7 +68,7 @@ def add(url: str, text: str):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     # Set createdAt to current UTC time in RFC 3339 format
@@ -77,20 +82,20 @@ def add(url: str, text: str):
             field = error["loc"][0]
             msg = error["msg"]
             if field == "url":
-                console.print(f"[red]✗ Invalid URL: {url}[/red]")
-                console.print(f"[yellow]{msg}[/yellow]")
+                console().print(f"[red]✗ Invalid URL: {url}[/red]")
+                console().print(f"[yellow]{msg}[/yellow]")
             elif field == "text":
                 if "String should have at most" in msg:
-                    console.print(
+                    console().print(
                         f"[red]✗ Text is too long: {len(text)} characters (max {SPICE_MAX_TEXT_LENGTH})[/red]"
                     )
                 else:
-                    console.print(f"[red]✗ {msg}[/red]")
+                    console().print(f"[red]✗ {msg}[/red]")
         raise SystemExit(1)
 
     # Create the record
     try:
-        console.print(f"[blue]Creating note for {url}...[/blue]")
+        console().print(f"[blue]Creating note for {url}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -109,13 +114,78 @@ def add(url: str, text: str):
         # Use the AT URI returned by the server
         at_uri = response.uri
 
-        console.print(f"[green]✓ Created: {at_uri}[/green]")
+        console().print(f"[green]✓ Created: {at_uri}[/green]")
 
     except AtProtocolError as e:
-        console.print(f"[red]✗ Failed to create note: {e}[/red]")
+        console().print(f"[red]✗ Failed to create note: {e}[/red]")
         raise SystemExit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to create note: {e}[/red]")
+
+
+@spice.command(name="add-bulk")
+@click.argument("file", type=click.File("r", encoding="utf-8"))
+def add_bulk(file):
+    """Add many notes at once from a JSON Lines file.
+
+    Each line must be a JSON object with "url" and "text" keys, and may
+    include a "createdAt" timestamp. Notes are written in batches of up to
+    200 records per request.
+
+    FILE: Path to a .jsonl file (use - to read from stdin)
+    """
+    # Load session
+    config = Config()
+    handle, session_string, pds_url = config.load_session()
+
+    if not session_string:
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        raise SystemExit(1)
+
+    # Validate every line before making any network calls
+    created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    notes = []
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            data = None
+        if not isinstance(data, dict):
+            console().print(f"[red]✗ Line {line_number}: expected a JSON object[/red]")
+            raise SystemExit(1)
+
+        try:
+            note = SpiceNote(url=data.get("url"), text=data.get("text"), createdAt=data.get("createdAt", created_at))
+        except ValidationError as e:
+            for error in e.errors():
+                reason = f"{error['loc'][0]}: {error['msg']}"
+                console().print(f"[red]✗ Line {line_number}: {escape(reason)}[/red]")
+            raise SystemExit(1)
+        notes.append(note)
+
+    if not notes:
+        console().print(f"[yellow]No notes found in {file.name}[/yellow]")
+        return
+
+    # Create the records
+    try:
+        console().print(f"[blue]Creating {len(notes)} note(s)...[/blue]")
+
+        # Create client with automatic session refresh
+        client = create_client_with_session_refresh(config, handle, session_string, pds_url)
+
+        repo = client.me.did
+        for start in range(0, len(notes), SPICE_BULK_BATCH_SIZE):
+            batch = notes[start : start + SPICE_BULK_BATCH_SIZE]
+            writes = [{**_CREATE_WRITE, "value": note.to_record()} for note in batch]
+            response = client.com.atproto.repo.apply_writes({"repo": repo, "writes": writes})
+
+            created = [f"[green]✓ Created: {result.uri}[/green]" for result in response.results or []]
+            if created:
+                console().print("\n".join(created))
+
+    except AtProtocolError as e:
+        console().print(f"[red]✗ Failed to create notes: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -136,14 +206,14 @@ def list(url: str, limit: int, fetch_all: bool):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     try:
         if url:
-            console.print(f"[blue]Loading notes for {url}...[/blue]")
+            console().print(f"[blue]Loading notes for {url}...[/blue]")
         else:
-            console.print("[blue]Loading all notes...[/blue]")
+            console().print("[blue]Loading all notes...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -152,63 +222,76 @@ def list(url: str, limit: int, fetch_all: bool):
         all_matching_records = []
         cursor = None
         api_page_size = 100  # Use larger page size for API calls to reduce requests
+        # Without a URL filter every record matches, so don't fetch more than will be shown.
+        # listRecords has no server-side filter on record values, and note keys are TIDs,
+        # so a URL filter still has to scan.
+        fill_limit = not url and limit is not None
 
         while True:
+            page_size = api_page_size
+            if fill_limit:
+                page_size = max(1, min(limit - len(all_matching_records), api_page_size))
+
             # List records in the collection with pagination
             params = {
                 "repo": client.me.did,
                 "collection": SPICE_COLLECTION_NAME,
-                "limit": api_page_size,
+                "limit": page_size,
             }
             if cursor:
                 params["cursor"] = cursor
 
             response = client.com.atproto.repo.list_records(params)
 
-            # Filter for matching URL (if provided) and convert to SpiceNote models
-            if url:
-                matching_records = [
-                    (r.uri, SpiceNote.from_record(r)) for r in response["records"] if r.value["url"] == url
-                ]
-            else:
-                matching_records = [(r.uri, SpiceNote.from_record(r)) for r in response["records"]]
-            all_matching_records.extend(matching_records)
+            # Filter for matching URL (if provided) and convert to SpiceNote models.
+            # Records written by other clients may not be valid notes, so skip those with a warning.
+            for r in response["records"]:
+                try:
+                    if url and r.value["url"] != url:
+                        continue
+                    note = SpiceNote.from_record(r)
+                except KeyError as e:
+                    console().print(f"[yellow]⚠ Skipping invalid note {r.uri}: missing field {e}[/yellow]")
+                    continue
+                except ValidationError as e:
+                    reason = "; ".join(f"{error['loc'][0]}: {error['msg']}" for error in e.errors())
+                    console().print(f"[yellow]⚠ Skipping invalid note {r.uri}: {escape(reason)}[/yellow]")
+                    continue
+                all_matching_records.append((r.uri, note))
 
             # Check if we've reached the limit
             if limit is not None and len(all_matching_records) >= limit:
                 all_matching_records = all_matching_records[:limit]
                 break
 
-            # Check if we should continue pagination
+            # Check if we should continue pagination. A page sized to the limit comes up
+            # short when it holds invalid records, so keep paging until the limit is filled.
             cursor = getattr(response, "cursor", None)
-            if not cursor or not fetch_all:
+            if not cursor or not (fetch_all or fill_limit):
                 break
 
         if not all_matching_records:
             if url:
-                console.print(f"[yellow]No notes found for {url}[/yellow]")
+                console().print(f"[yellow]No notes found for {url}[/yellow]")
             else:
-                console.print("[yellow]No notes found[/yellow]")
+                console().print("[yellow]No notes found[/yellow]")
             return
 
         # Reverse the order to show latest at the bottom
         all_matching_records.reverse()
 
         # Display each matching record
-        console.print(f"\n[green]Found {len(all_matching_records)} note(s):[/green]\n")
+        console().print(f"\n[green]Found {len(all_matching_records)} note(s):[/green]\n")
 
         # Cache profiles to avoid redundant API calls
         profile_cache = {}
 
-        for at_uri, note in all_matching_records:
-            table = display_spice_note(note, at_uri, client, profile_cache)
-            console.print(table)
+        # Render all notes in a single print call
+        tables = [display_spice_note(note, at_uri, client, profile_cache) for at_uri, note in all_matching_records]
+        console().print(Group(*tables))
 
     except AtProtocolError as e:
-        console.print(f"[red]✗ Failed to list notes: {e}[/red]")
-        raise SystemExit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to list notes: {e}[/red]")
+        console().print(f"[red]✗ Failed to list notes: {e}[/red]")
         raise SystemExit(1)
 
 
@@ -226,26 +309,26 @@ def delete(at_uri: str):
     handle, session_string, pds_url = config.load_session()
 
     if not session_string:
-        console.print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
+        console().print("[red]✗ Not logged in. Please run 'atpcli login' first.[/red]")
         raise SystemExit(1)
 
     # Parse and validate AT URI
     try:
         repo_did, collection, rkey = parse_at_uri(at_uri)
     except ValueError as e:
-        console.print(f"[red]✗ {e}[/red]")
-        console.print("[yellow]Expected format: at://did:plc:xxx/collection/rkey[/yellow]")
+        console().print(f"[red]✗ {e}[/red]")
+        console().print("[yellow]Expected format: at://did:plc:xxx/collection/rkey[/yellow]")
         raise SystemExit(1)
 
     # Validate collection
     if collection != SPICE_COLLECTION_NAME:
-        console.print(f"[red]✗ Invalid collection: {collection}[/red]")
-        console.print(f"[yellow]This command only deletes {SPICE_COLLECTION_NAME} records[/yellow]")
+        console().print(f"[red]✗ Invalid collection: {collection}[/red]")
+        console().print(f"[yellow]This command only deletes {SPICE_COLLECTION_NAME} records[/yellow]")
         raise SystemExit(1)
 
     # Delete the record
     try:
-        console.print(f"[blue]Deleting note {at_uri}...[/blue]")
+        console().print(f"[blue]Deleting note {at_uri}...[/blue]")
 
         # Create client with automatic session refresh
         client = create_client_with_session_refresh(config, handle, session_string, pds_url)
@@ -259,13 +342,10 @@ def delete(at_uri: str):
             }
         )
 
-        console.print(f"[green]✓ Deleted: {at_uri}[/green]")
+        console().print(f"[green]✓ Deleted: {at_uri}[/green]")
 
     except AtProtocolError as e:
-        console.print(f"[red]✗ Failed to delete note: {e}[/red]")
+        console().print(f"[red]✗ Failed to delete note: {e}[/red]")
         if "not found" in str(e).lower():
-            console.print("[yellow]Record may not exist or may have already been deleted.[/yellow]")
-        raise SystemExit(1)
-    except Exception as e:
-        console.print(f"[red]✗ Failed to delete note: {e}[/red]")
+            console().print("[yellow]Record may not exist or may have already been deleted.[/yellow]")
         raise SystemExit(1)
@@ -0,0 +1,189 @@
+"""Shared fixtures for atpcli tests."""
+
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, List, Optional
+from unittest.mock import DEFAULT, MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from atpcli import cli as cli_module
+from atpcli import spice as spice_module
+
+
+@dataclass
+class FakeAuthor:
+    """Stand-in for a post author with the fields the display code reads."""
+
+    display_name: Optional[str] = "Test User"
+    handle: str = "test.bsky.social"
+
+
+@dataclass
+class FakeRecord:
+    """Stand-in for a post record."""
+
+    text: str = "Test post"
+    facets: Optional[List[Any]] = None
+    reply: Optional[Any] = None
+
+
+@dataclass
+class FakePost:
+    """Stand-in for a PostView."""
+
+    author: FakeAuthor = field(default_factory=FakeAuthor)
+    record: FakeRecord = field(default_factory=FakeRecord)
+    like_count: int = 5
+    uri: str = "at://did:plc:test123/app.bsky.feed.post/abc123"
+    embed: Optional[Any] = None
+    reply: Optional[Any] = None
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Create a CLI runner shared by the whole test session.
+
+    CliRunner holds no state between invocations, so one instance is enough.
+    A fixed plain terminal keeps Click and Rich from probing for colour
+    support and width on each invocation.
+    """
+    return CliRunner(env={"NO_COLOR": "1", "TERM": "dumb", "COLUMNS": "80", "LINES": "24"})
+
+
+@pytest.fixture
+def cli_mocks():
+    """Patch atpcli.cli's Config and client factory with a single patch.multiple.
+
+    Yields:
+        Dict of mocks keyed by attribute name
+    """
+    with patch.multiple(cli_module, Config=DEFAULT, create_client_with_session_refresh=DEFAULT) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def mock_not_logged_in(cli_mocks):
+    """Configure the patched Config to report no saved session.
+
+    Returns:
+        The mock Config instance
+    """
+    mock_config = cli_mocks["Config"].return_value
+    mock_config.load_session.return_value = (None, None, "https://bsky.social")
+    return mock_config
+
+
+@pytest.fixture
+def logged_in_client(cli_mocks):
+    """Simulate a logged-in session on top of cli_mocks.
+
+    Returns:
+        Tuple of (mock_client, mock_config, mock_create_client)
+    """
+    mock_create_client = cli_mocks["create_client_with_session_refresh"]
+    mock_client = MagicMock()
+    mock_create_client.return_value = mock_client
+    mock_config = cli_mocks["Config"].return_value
+    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
+    return mock_client, mock_config, mock_create_client
+
+
+@pytest.fixture
+def spice_mocks(monkeypatch):
+    """Replace atpcli.spice's Config and client factory with mocks.
+
+    Returns:
+        SimpleNamespace with the Config instance (config) and the client factory (create_client)
+    """
+    mock_config_class = MagicMock()
+    mock_create_client = MagicMock()
+    monkeypatch.setattr(spice_module, "Config", mock_config_class)
+    monkeypatch.setattr(spice_module, "create_client_with_session_refresh", mock_create_client)
+    return SimpleNamespace(config=mock_config_class.return_value, create_client=mock_create_client)
+
+
+@pytest.fixture
+def spice_not_logged_in(spice_mocks):
+    """Configure the patched spice Config to report no saved session.
+
+    Returns:
+        The mock Config instance
+    """
+    mock_config = spice_mocks.config
+    mock_config.load_session.return_value = (None, None, "https://bsky.social")
+    return mock_config
+
+
+@pytest.fixture
+def spice_logged_in(spice_mocks):
+    """Configure the patched spice Config to report a saved session.
+
+    Returns:
+        The mock Config instance
+    """
+    mock_config = spice_mocks.config
+    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
+    return mock_config
+
+
+@pytest.fixture
+def spice_client(spice_mocks, spice_logged_in):
+    """Simulate a logged-in spice session whose client belongs to did:plc:test123.
+
+    The client is a plain namespace tree; only com.atproto.repo is a MagicMock, so
+    tests can set return values on and assert calls to its record methods.
+
+    Returns:
+        The client returned by the patched client factory
+    """
+    client = SimpleNamespace(
+        me=SimpleNamespace(did="did:plc:test123"),
+        com=SimpleNamespace(atproto=SimpleNamespace(repo=MagicMock())),
+    )
+    spice_mocks.create_client.return_value = client
+    return client
+
+
+@pytest.fixture(scope="session")
+def invoke_ok(runner):
+    """Invoke a command that is expected to succeed.
+
+    Exceptions are not caught, so an unexpected error fails the test with its
+    own traceback instead of surfacing as a non-zero exit code.
+    """
+
+    def invoke(command, args=None, **kwargs):
+        return runner.invoke(command, args, catch_exceptions=False, **kwargs)
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def make_post():
+    """Build a FakePost, taking record fields (text, facets, reply) and post fields as keywords.
+
+    Returns:
+        Callable returning a new FakePost
+    """
+
+    def make(text="Test post", facets=None, reply=None, **kwargs):
+        return FakePost(record=FakeRecord(text=text, facets=facets, reply=reply), **kwargs)
+
+    return make
+
+
+@pytest.fixture
+def sample_post_view(make_post):
+    """Build a post with the fields the display code reads.
+
+    Tests override individual fields (e.g. record.text) as needed.
+    """
+    return make_post()
+
+
+@pytest.fixture
+def sample_timeline_response(sample_post_view):
+    """Build a single-page timeline/feed response containing sample_post_view."""
+    return SimpleNamespace(feed=[SimpleNamespace(post=sample_post_view)], cursor=None)
@@ -1,635 +1,397 @@
 """Tests for CLI commands."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
-from click.testing import CliRunner
 
-from atpcli.cli import cli
-
-
-@pytest.fixture
-def runner():
-    """Create a CLI runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def temp_config():
-    """Create a temporary config directory."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
-
-
-def test_cli_group(runner):
-    """Test that CLI group runs."""
-    result = runner.invoke(cli, ["--help"])
-    assert result.exit_code == 0
-    assert "atpcli" in result.output
-
-
-def test_bsky_group(runner):
-    """Test that bsky group runs."""
-    result = runner.invoke(cli, ["bsky", "--help"])
-    assert result.exit_code == 0
-    assert "Commands for interacting with Bluesky" in result.output
-
-
-def test_login_command_help(runner):
-    """Test login command help."""
-    result = runner.invoke(cli, ["login", "--help"])
-    assert result.exit_code == 0
-    assert "Login" in result.output
-
-
-def test_timeline_command_help(runner):
-    """Test timeline command help."""
-    result = runner.invoke(cli, ["bsky", "timeline", "--help"])
-    assert result.exit_code == 0
-    assert "View your timeline" in result.output
-
-
-@patch("atpcli.cli.Client")
-@patch("atpcli.cli.Config")
-def test_login_success(mock_config_class, mock_client_class, runner, temp_config):
-    """Test successful login."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_client_class.return_value = mock_client
-
-    mock_profile = MagicMock()
-    mock_profile.display_name = "Test User"
-    mock_client.login.return_value = mock_profile
-    mock_client.export_session_string.return_value = "test_session"
-
-    mock_config = MagicMock()
-    mock_config.config_file = temp_config / "config.json"
-    mock_config_class.return_value = mock_config
-
-    # Run login
-    result = runner.invoke(cli, ["login", "--handle", "test.bsky.social", "--password", "testpass"])
-
-    # Verify
+from atpcli import cli as cli_module
+from atpcli.cli import bsky, cli, feed, feeds, login, post, timeline
+
+# Config is mocked in these tests, so nothing is ever written to this path
+FAKE_CFG = Path("/fake/config.json")
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"),
+    [
+        (cli, "atpcli"),
+        (bsky, "Commands for interacting with Bluesky"),
+        (login, "Login"),
+        (timeline, "View your timeline"),
+        (post, "Post a message to Bluesky"),
+        (feeds, "List your saved feeds"),
+        (feed, "View posts from a specific feed"),
+    ],
+    ids=["cli", "bsky", "login", "timeline", "post", "feeds", "feed"],
+)
+def test_command_help(invoke_ok, command, expected):
+    """Test that each command's help renders."""
+    result = invoke_ok(command, ["--help"])
     assert result.exit_code == 0
-    assert "Successfully logged in" in result.output
-    mock_client_class.assert_called_once_with(base_url="https://bsky.social")
-    mock_client.login.assert_called_once_with("test.bsky.social", "testpass")
-    mock_config.save_session.assert_called_once_with("test.bsky.social", "test_session", "https://bsky.social")
-
-
-@patch("atpcli.cli.Client")
-@patch("atpcli.cli.Config")
-def test_login_custom_pds(mock_config_class, mock_client_class, runner, temp_config):
-    """Test login with custom PDS URL."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_client_class.return_value = mock_client
-
-    mock_profile = MagicMock()
-    mock_profile.display_name = "Test User"
-    mock_client.login.return_value = mock_profile
-    mock_client.export_session_string.return_value = "test_session"
-
-    mock_config = MagicMock()
-    mock_config.config_file = temp_config / "config.json"
-    mock_config_class.return_value = mock_config
-
-    # Run login with custom PDS
-    result = runner.invoke(
-        cli, ["login", "https://my-pds.com", "--handle", "test.custom.social", "--password", "testpass"]
+    assert expected in result.output
+
+
+class TestLogin:
+    """Tests for the login command."""
+
+    @pytest.fixture
+    def mocks(self):
+        """Patch atpcli's Client class and Config."""
+        with (
+            patch.object(cli_module, "Client") as mock_client_class,
+            patch.object(cli_module, "Config") as mock_config_class,
+        ):
+            yield {"Client": mock_client_class, "Config": mock_config_class}
+
+    @pytest.mark.parametrize(
+        ("extra_args", "expected_base_url", "handle"),
+        [
+            ([], "https://bsky.social", "test.bsky.social"),
+            (["https://my-pds.com"], "https://my-pds.com", "test.custom.social"),
+        ],
+        ids=["default_pds", "custom_pds"],
     )
-
-    # Verify custom PDS URL was used
-    assert result.exit_code == 0
-    assert "Successfully logged in" in result.output
-    mock_client_class.assert_called_once_with(base_url="https://my-pds.com")
-    mock_config.save_session.assert_called_once_with("test.custom.social", "test_session", "https://my-pds.com")
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_timeline_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test timeline when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["bsky", "timeline"])
-
-    assert result.exit_code == 1
-    assert "Not logged in" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_timeline_success(mock_config_class, mock_create_client, runner):
-    """Test successful timeline fetch."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock timeline response
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test Author"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Test post"
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-
-    mock_feed_view = MagicMock()
-    mock_feed_view.post = mock_post
-
-    mock_timeline = MagicMock()
-    mock_timeline.feed = [mock_feed_view]
-    mock_timeline.cursor = None
-    mock_client.get_timeline.return_value = mock_timeline
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run timeline
-    result = runner.invoke(cli, ["bsky", "timeline", "--limit", "10"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Loading timeline for test.bsky.social" in result.output
-    assert "Test Author" in result.output
-    assert "Test post" in result.output
-    assert "Showing 1 post" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    mock_client.get_timeline.assert_called_once_with(limit=10, cursor=None)
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_timeline_with_pagination(mock_config_class, mock_create_client, runner):
-    """Test timeline with pagination."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock timeline response for page 1
-    mock_timeline_page1 = MagicMock()
-    mock_timeline_page1.feed = []
-    mock_timeline_page1.cursor = "cursor_page_2"
-
-    # Mock timeline response for page 2
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test Author"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Test post on page 2"
-    mock_post.like_count = 3
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/xyz789"
-
-    mock_feed_view = MagicMock()
-    mock_feed_view.post = mock_post
-
-    mock_timeline_page2 = MagicMock()
-    mock_timeline_page2.feed = [mock_feed_view]
-    mock_timeline_page2.cursor = "cursor_page_3"
-
-    # Mock get_timeline to return different responses
-    mock_client.get_timeline.side_effect = [mock_timeline_page1, mock_timeline_page2]
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run timeline with page 2
-    result = runner.invoke(cli, ["bsky", "timeline", "--limit", "5", "--p", "2"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Loading timeline for test.bsky.social" in result.output
-    assert "Test post on page 2" in result.output
-    assert "page 2" in result.output
-    assert "--p 3" in result.output  # Should show next page hint
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    # Should be called twice: once to skip page 1, once to get page 2
-    assert mock_client.get_timeline.call_count == 2
-
-
-def test_post_command_help(runner):
-    """Test post command help."""
-    result = runner.invoke(cli, ["bsky", "post", "--help"])
-    assert result.exit_code == 0
-    assert "Post a message to Bluesky" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test post when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["bsky", "post", "--message", "Test post"])
-
-    assert result.exit_code == 1
-    assert "Not logged in" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_success(mock_config_class, mock_create_client, runner):
-    """Test successful post."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock post response
-    mock_response = MagicMock()
-    mock_response.uri = "at://did:plc:test123/app.bsky.feed.post/abc123xyz"
-    mock_client.send_post.return_value = mock_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run post
-    result = runner.invoke(cli, ["bsky", "post", "--message", "Hello Bluesky!"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Post created successfully" in result.output
-    assert "https://bsky.app/profile/test.bsky.social/post/abc123xyz" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    mock_client.send_post.assert_called_once_with(text="Hello Bluesky!")
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_with_short_option(mock_config_class, mock_create_client, runner):
-    """Test post with -m short option."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock post response
-    mock_response = MagicMock()
-    mock_response.uri = "at://did:plc:test123/app.bsky.feed.post/abc123xyz"
-    mock_client.send_post.return_value = mock_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run post with -m short option
-    result = runner.invoke(cli, ["bsky", "post", "-m", "Quick post!"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Post created successfully" in result.output
-    mock_client.send_post.assert_called_once_with(text="Quick post!")
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_failure(mock_config_class, mock_create_client, runner):
-    """Test post failure."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.send_post.side_effect = Exception("Network error")
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run post
-    result = runner.invoke(cli, ["bsky", "post", "--message", "Hello Bluesky!"])
-
-    # Verify
-    assert result.exit_code == 1
-    assert "Failed to post" in result.output
-    assert "Network error" in result.output
-
-
-@patch("atpcli.cli.get_message_from_editor")
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_with_editor(mock_config_class, mock_create_client, mock_get_message, runner):
-    """Test post using editor when -m is not provided."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock editor returning a message
-    mock_get_message.return_value = "Message from editor"
-
-    # Mock post response
-    mock_response = MagicMock()
-    mock_response.uri = "at://did:plc:test123/app.bsky.feed.post/abc123xyz"
-    mock_client.send_post.return_value = mock_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run post without -m option
-    result = runner.invoke(cli, ["bsky", "post"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Post created successfully" in result.output
-    mock_get_message.assert_called_once()
-    mock_client.send_post.assert_called_once_with(text="Message from editor")
-
-
-@patch("atpcli.cli.get_message_from_editor")
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_post_editor_empty_message(mock_config_class, mock_create_client, mock_get_message, runner):
-    """Test post with editor when user provides empty message."""
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Mock editor returning empty message (which causes SystemExit(0))
-    mock_get_message.side_effect = SystemExit(0)
-
-    # Run post without -m option
-    result = runner.invoke(cli, ["bsky", "post"])
-
-    # Verify - SystemExit(0) is caught by click and results in exit code 0
-    assert result.exit_code == 0
-    mock_get_message.assert_called_once()
-
-
-def test_feeds_command_help(runner):
-    """Test feeds command help."""
-    result = runner.invoke(cli, ["bsky", "feeds", "--help"])
-    assert result.exit_code == 0
-    assert "List your saved feeds" in result.output
-
-
-def test_feed_command_help(runner):
-    """Test feed command help."""
-    result = runner.invoke(cli, ["bsky", "feed", "--help"])
-    assert result.exit_code == 0
-    assert "View posts from a specific feed" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feeds_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test feeds when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["bsky", "feeds"])
-
-    assert result.exit_code == 1
-    assert "Not logged in" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feeds_success_table_format(mock_config_class, mock_create_client, runner):
-    """Test successful feeds fetch with table format."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock saved feeds preference
-    mock_pref = MagicMock()
-    mock_pref.py_type = "app.bsky.actor.defs#savedFeedsPref"
-    mock_pref.saved = ["at://did:plc:test/app.bsky.feed.generator/discover"]
-
-    mock_preferences = MagicMock()
-    mock_preferences.preferences = [mock_pref]
-    mock_client.app.bsky.actor.get_preferences.return_value = mock_preferences
-
-    # Mock feed generator info
-    mock_feed_view = MagicMock()
-    mock_feed_view.display_name = "Discover Feed"
-    mock_feed_view.description = "Discover new content"
-
-    mock_feed_info = MagicMock()
-    mock_feed_info.view = mock_feed_view
-    mock_client.app.bsky.feed.get_feed_generator.return_value = mock_feed_info
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feeds
-    result = runner.invoke(cli, ["bsky", "feeds"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Loading saved feeds for test.bsky.social" in result.output
-    assert "Discover Feed" in result.output
-    assert "Saved Feeds (1)" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    mock_client.app.bsky.actor.get_preferences.assert_called_once()
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feeds_success_uri_format(mock_config_class, mock_create_client, runner):
-    """Test successful feeds fetch with URI format."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock saved feeds preference
-    mock_pref = MagicMock()
-    mock_pref.py_type = "app.bsky.actor.defs#savedFeedsPref"
-    mock_pref.saved = [
-        "at://did:plc:test/app.bsky.feed.generator/discover",
-        "at://did:plc:test/app.bsky.feed.generator/popular",
-    ]
-
-    mock_preferences = MagicMock()
-    mock_preferences.preferences = [mock_pref]
-    mock_client.app.bsky.actor.get_preferences.return_value = mock_preferences
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feeds with URI format
-    result = runner.invoke(cli, ["bsky", "feeds", "--format", "uri"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "at://did:plc:test/app.bsky.feed.generator/discover" in result.output
-    assert "at://did:plc:test/app.bsky.feed.generator/popular" in result.output
-    # Should not call get_feed_generator for URI format
-    mock_client.app.bsky.feed.get_feed_generator.assert_not_called()
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feeds_empty(mock_config_class, mock_create_client, runner):
-    """Test feeds when no saved feeds exist."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock empty preferences
-    mock_preferences = MagicMock()
-    mock_preferences.preferences = []
-    mock_client.app.bsky.actor.get_preferences.return_value = mock_preferences
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feeds
-    result = runner.invoke(cli, ["bsky", "feeds"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "No saved feeds found" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feed_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test feed when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["bsky", "feed", "at://did:plc:test/app.bsky.feed.generator/discover"])
-
-    assert result.exit_code == 1
-    assert "Not logged in" in result.output
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feed_success(mock_config_class, mock_create_client, runner):
-    """Test successful feed fetch."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock feed response
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test Author"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Test post from feed"
-    mock_post.like_count = 7
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/xyz123"
-
-    mock_feed_view = MagicMock()
-    mock_feed_view.post = mock_post
-
-    mock_feed_response = MagicMock()
-    mock_feed_response.feed = [mock_feed_view]
-    mock_feed_response.cursor = None
-    mock_client.app.bsky.feed.get_feed.return_value = mock_feed_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feed
-    feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
-    result = runner.invoke(cli, ["bsky", "feed", feed_uri, "--limit", "10"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert f"Loading feed {feed_uri}" in result.output
-    assert "Test Author" in result.output
-    assert "Test post from feed" in result.output
-    assert "Showing 1 post" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    mock_client.app.bsky.feed.get_feed.assert_called_once()
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feed_with_pagination(mock_config_class, mock_create_client, runner):
-    """Test feed with pagination."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock feed response for page 1
-    mock_feed_page1 = MagicMock()
-    mock_feed_page1.feed = []
-    mock_feed_page1.cursor = "cursor_page_2"
-
-    # Mock feed response for page 2
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test Author"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Test post on page 2"
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc789"
-
-    mock_feed_view = MagicMock()
-    mock_feed_view.post = mock_post
-
-    mock_feed_page2 = MagicMock()
-    mock_feed_page2.feed = [mock_feed_view]
-    mock_feed_page2.cursor = "cursor_page_3"
-
-    # Mock get_feed to return different responses
-    mock_client.app.bsky.feed.get_feed.side_effect = [mock_feed_page1, mock_feed_page2]
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feed with page 2
-    feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
-    result = runner.invoke(cli, ["bsky", "feed", feed_uri, "--limit", "5", "--p", "2"])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "Test post on page 2" in result.output
-    assert "page 2" in result.output
-    assert "--p 3" in result.output  # Should show next page hint
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
-    # Should be called twice: once to skip page 1, once to get page 2
-    assert mock_client.app.bsky.feed.get_feed.call_count == 2
-
-
-@patch("atpcli.cli.create_client_with_session_refresh")
-@patch("atpcli.cli.Config")
-def test_feed_empty(mock_config_class, mock_create_client, runner):
-    """Test feed with no posts."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-
-    # Mock empty feed response
-    mock_feed_response = MagicMock()
-    mock_feed_response.feed = []
-    mock_feed_response.cursor = None
-    mock_client.app.bsky.feed.get_feed.return_value = mock_feed_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Run feed
-    feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
-    result = runner.invoke(cli, ["bsky", "feed", feed_uri])
-
-    # Verify
-    assert result.exit_code == 0
-    assert "This feed has no posts" in result.output
+    def test_login_success(self, mocks, invoke_ok, extra_args, expected_base_url, handle):
+        """Test successful login against the default and a custom PDS."""
+        mock_client_class = mocks["Client"]
+        mock_client = mock_client_class.return_value
+
+        mock_profile = SimpleNamespace(display_name="Test User")
+        mock_client.login.return_value = mock_profile
+        mock_client.export_session_string.return_value = "test_session"
+
+        mock_config = mocks["Config"].return_value
+        mock_config.config_file = FAKE_CFG
+
+        # Run login
+        result = invoke_ok(login, [*extra_args, "--handle", handle, "--password", "testpass"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Successfully logged in" in result.output
+        assert f"Session saved to {FAKE_CFG}" in result.output
+        mock_client_class.assert_called_once_with(base_url=expected_base_url)
+        mock_client.login.assert_called_once_with(handle, "testpass")
+        mock_config.save_session.assert_called_once_with(handle, "test_session", expected_base_url)
+
+
+@pytest.mark.usefixtures("cli_mocks")
+class TestBskyCommands:
+    """Tests shared by all bsky subcommands."""
+
+    @pytest.mark.parametrize(
+        ("command", "args"),
+        [
+            (timeline, []),
+            (post, ["--message", "Test post"]),
+            (feeds, []),
+            (feed, ["at://did:plc:test/app.bsky.feed.generator/discover"]),
+        ],
+        ids=["timeline", "post", "feeds", "feed"],
+    )
+    def test_not_logged_in(self, mock_not_logged_in, runner, command, args):
+        """Test that every bsky command refuses to run when not logged in."""
+        result = runner.invoke(command, args)
+
+        assert result.exit_code == 1
+        assert "Not logged in" in result.output
+
+
+class TestTimeline:
+    """Tests for the timeline command."""
+
+    def test_timeline_success(self, logged_in_client, invoke_ok, sample_timeline_response):
+        """Test successful timeline fetch."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+        mock_client.get_timeline.return_value = sample_timeline_response
+
+        # Run timeline
+        result = invoke_ok(timeline, ["--limit", "10"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Loading timeline for test.bsky.social" in result.output
+        assert "Test User" in result.output
+        assert "Test post" in result.output
+        assert "Showing 1 post" in result.output
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        mock_client.get_timeline.assert_called_once_with(limit=10, cursor=None)
+
+    def test_timeline_with_pagination(self, logged_in_client, invoke_ok, sample_post_view, sample_timeline_response):
+        """Test timeline with pagination."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+
+        # Mock timeline response for page 1
+        mock_timeline_page1 = SimpleNamespace(feed=[], cursor="cursor_page_2")
+
+        # Mock timeline response for page 2
+        sample_post_view.record.text = "Test post on page 2"
+        mock_timeline_page2 = sample_timeline_response
+        mock_timeline_page2.cursor = "cursor_page_3"
+
+        # Mock get_timeline to return different responses
+        mock_client.get_timeline.side_effect = [mock_timeline_page1, mock_timeline_page2]
+
+        # Run timeline with page 2
+        result = invoke_ok(timeline, ["--limit", "5", "--p", "2"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Loading timeline for test.bsky.social" in result.output
+        assert "Test post on page 2" in result.output
+        assert "page 2" in result.output
+        assert "--p 3" in result.output  # Should show next page hint
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        # Should be called twice: once to skip page 1, once to get page 2
+        assert mock_client.get_timeline.call_count == 2
+
+
+class TestPost:
+    """Tests for the post command."""
+
+    def test_post_success(self, logged_in_client, invoke_ok):
+        """Test successful post."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+
+        # Mock post response
+        mock_response = SimpleNamespace(uri="at://did:plc:test123/app.bsky.feed.post/abc123xyz")
+        mock_client.send_post.return_value = mock_response
+
+        # Run post
+        result = invoke_ok(post, ["--message", "Hello Bluesky!"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Post created successfully" in result.output
+        assert "https://bsky.app/profile/test.bsky.social/post/abc123xyz" in result.output
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        mock_client.send_post.assert_called_once_with(text="Hello Bluesky!")
+
+    def test_post_with_short_option(self, logged_in_client, invoke_ok):
+        """Test post with -m short option."""
+        mock_client, _, _ = logged_in_client
+
+        # Mock post response
+        mock_response = SimpleNamespace(uri="at://did:plc:test123/app.bsky.feed.post/abc123xyz")
+        mock_client.send_post.return_value = mock_response
+
+        # Run post with -m short option
+        result = invoke_ok(post, ["-m", "Quick post!"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Post created successfully" in result.output
+        mock_client.send_post.assert_called_once_with(text="Quick post!")
+
+    def test_post_failure(self, logged_in_client, runner):
+        """Test post failure."""
+        mock_client, _, _ = logged_in_client
+
+        mock_client.send_post.side_effect = Exception("Network error")
+
+        # Run post
+        result = runner.invoke(post, ["--message", "Hello Bluesky!"])
+
+        # Verify
+        assert result.exit_code == 1
+        assert "Failed to post" in result.output
+        assert "Network error" in result.output
+
+    @patch.object(cli_module, "get_message_from_editor")
+    def test_post_with_editor(self, mock_get_message, logged_in_client, invoke_ok):
+        """Test post using editor when -m is not provided."""
+        mock_client, _, _ = logged_in_client
+
+        # Mock editor returning a message
+        mock_get_message.return_value = "Message from editor"
+
+        # Mock post response
+        mock_response = SimpleNamespace(uri="at://did:plc:test123/app.bsky.feed.post/abc123xyz")
+        mock_client.send_post.return_value = mock_response
+
+        # Run post without -m option
+        result = invoke_ok(post)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Post created successfully" in result.output
+        mock_get_message.assert_called_once()
+        mock_client.send_post.assert_called_once_with(text="Message from editor")
+
+    @patch.object(cli_module, "get_message_from_editor")
+    def test_post_editor_empty_message(self, mock_get_message, logged_in_client, runner):
+        """Test post with editor when user provides empty message."""
+        # Mock editor returning empty message (which causes SystemExit(0))
+        mock_get_message.side_effect = SystemExit(0)
+
+        # Run post without -m option
+        result = runner.invoke(post)
+
+        # Verify - SystemExit(0) is caught by click and results in exit code 0
+        assert result.exit_code == 0
+        mock_get_message.assert_called_once()
+
+
+class TestFeeds:
+    """Tests for the feeds command."""
+
+    def test_feeds_success_table_format(self, logged_in_client, invoke_ok):
+        """Test successful feeds fetch with table format."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+
+        # Mock saved feeds preference (feeds reads the raw getPreferences JSON)
+        mock_client._base_url = "https://bsky.social/xrpc"
+        get_prefs = mock_client.request.get
+        get_prefs.return_value = SimpleNamespace(
+            content={
+                "preferences": [
+                    {
+                        "$type": "app.bsky.actor.defs#savedFeedsPref",
+                        "saved": ["at://did:plc:test/app.bsky.feed.generator/discover"],
+                    }
+                ]
+            }
+        )
+
+        # Mock feed generator info
+        mock_feed_view = SimpleNamespace(display_name="Discover Feed", description="Discover new content")
+
+        mock_feed_info = SimpleNamespace(view=mock_feed_view)
+        mock_client.app.bsky.feed.get_feed_generator.return_value = mock_feed_info
+
+        # Run feeds
+        result = invoke_ok(feeds)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Loading saved feeds for test.bsky.social" in result.output
+        assert "Discover Feed" in result.output
+        assert "Saved Feeds (1)" in result.output
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        get_prefs.assert_called_once_with("https://bsky.social/xrpc/app.bsky.actor.getPreferences")
+
+    def test_feeds_success_uri_format(self, logged_in_client, invoke_ok):
+        """Test successful feeds fetch with URI format."""
+        mock_client, _, _ = logged_in_client
+
+        # Mock saved feeds preference
+        mock_client.request.get.return_value = SimpleNamespace(
+            content={
+                "preferences": [
+                    {
+                        "$type": "app.bsky.actor.defs#savedFeedsPref",
+                        "saved": [
+                            "at://did:plc:test/app.bsky.feed.generator/discover",
+                            "at://did:plc:test/app.bsky.feed.generator/popular",
+                        ],
+                    }
+                ]
+            }
+        )
+
+        # Run feeds with URI format
+        result = invoke_ok(feeds, ["--format", "uri"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "at://did:plc:test/app.bsky.feed.generator/discover" in result.output
+        assert "at://did:plc:test/app.bsky.feed.generator/popular" in result.output
+        # Should not call get_feed_generator for URI format
+        mock_client.app.bsky.feed.get_feed_generator.assert_not_called()
+
+    def test_feeds_empty(self, logged_in_client, invoke_ok):
+        """Test feeds when no saved feeds exist."""
+        mock_client, _, _ = logged_in_client
+
+        # Mock empty preferences
+        mock_client.request.get.return_value = SimpleNamespace(content={"preferences": []})
+
+        # Run feeds
+        result = invoke_ok(feeds)
+
+        # Verify
+        assert result.exit_code == 0
+        assert "No saved feeds found" in result.output
+
+
+class TestFeed:
+    """Tests for the feed command."""
+
+    def test_feed_success(self, logged_in_client, invoke_ok, sample_post_view, sample_timeline_response):
+        """Test successful feed fetch."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+
+        # Mock feed response
+        sample_post_view.record.text = "Test post from feed"
+        mock_client.app.bsky.feed.get_feed.return_value = sample_timeline_response
+
+        # Run feed
+        feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
+        result = invoke_ok(feed, [feed_uri, "--limit", "10"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert f"Loading feed {feed_uri}" in result.output
+        assert "Test User" in result.output
+        assert "Test post from feed" in result.output
+        assert "Showing 1 post" in result.output
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        mock_client.app.bsky.feed.get_feed.assert_called_once()
+
+    def test_feed_with_pagination(self, logged_in_client, invoke_ok, sample_post_view, sample_timeline_response):
+        """Test feed with pagination."""
+        mock_client, mock_config, mock_create_client = logged_in_client
+
+        # Mock feed response for page 1
+        mock_feed_page1 = SimpleNamespace(feed=[], cursor="cursor_page_2")
+
+        # Mock feed response for page 2
+        sample_post_view.record.text = "Test post on page 2"
+        mock_feed_page2 = sample_timeline_response
+        mock_feed_page2.cursor = "cursor_page_3"
+
+        # Mock get_feed to return different responses
+        mock_client.app.bsky.feed.get_feed.side_effect = [mock_feed_page1, mock_feed_page2]
+
+        # Run feed with page 2
+        feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
+        result = invoke_ok(feed, [feed_uri, "--limit", "5", "--p", "2"])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "Test post on page 2" in result.output
+        assert "page 2" in result.output
+        assert "--p 3" in result.output  # Should show next page hint
+        mock_create_client.assert_called_once_with(
+            mock_config, "test.bsky.social", "test_session", "https://bsky.social"
+        )
+        # Should be called twice: once to skip page 1, once to get page 2
+        assert mock_client.app.bsky.feed.get_feed.call_count == 2
+
+    def test_feed_empty(self, logged_in_client, invoke_ok):
+        """Test feed with no posts."""
+        mock_client, _, _ = logged_in_client
+
+        # Mock empty feed response
+        mock_feed_response = SimpleNamespace(feed=[], cursor=None)
+        mock_client.app.bsky.feed.get_feed.return_value = mock_feed_response
+
+        # Run feed
+        feed_uri = "at://did:plc:test/app.bsky.feed.generator/discover"
+        result = invoke_ok(feed, [feed_uri])
+
+        # Verify
+        assert result.exit_code == 0
+        assert "This feed has no posts" in result.output
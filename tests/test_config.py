@@ -1,91 +1,83 @@
 """Tests for config module."""
 
-import tempfile
 from pathlib import Path
 
 from atpcli.config import Config
 
 
-def test_config_initialization():
+def test_config_initialization(tmp_path: Path):
     """Test that config initializes properly."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
-        assert config.config_dir.exists()
-        assert config.config_file.parent == config.config_dir
+    config = Config(config_dir=tmp_path)
+    assert config.config_dir.exists()
+    assert config.config_file.parent == config.config_dir
 
 
-def test_save_and_load_session():
+def test_save_and_load_session(tmp_path: Path):
     """Test saving and loading session."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
+    config = Config(config_dir=tmp_path)
 
-        # Save session
-        config.save_session("test.bsky.social", "test_session_string")
+    # Save session
+    config.save_session("test.bsky.social", "test_session_string")
 
-        # Load session
-        handle, session, pds_url = config.load_session()
-        assert handle == "test.bsky.social"
-        assert session == "test_session_string"
-        assert pds_url == "https://bsky.social"  # Default PDS URL
+    # Load session
+    handle, session, pds_url = config.load_session()
+    assert handle == "test.bsky.social"
+    assert session == "test_session_string"
+    assert pds_url == "https://bsky.social"  # Default PDS URL
 
 
-def test_load_session_when_no_config():
+def test_load_session_when_no_config(tmp_path: Path):
     """Test loading session when no config exists."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
-        handle, session, pds_url = config.load_session()
-        assert handle is None
-        assert session is None
-        assert pds_url == "https://bsky.social"  # Default PDS URL
+    config = Config(config_dir=tmp_path)
+    handle, session, pds_url = config.load_session()
+    assert handle is None
+    assert session is None
+    assert pds_url == "https://bsky.social"  # Default PDS URL
 
 
-def test_clear_session():
+def test_clear_session(tmp_path: Path):
     """Test clearing session."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
+    config = Config(config_dir=tmp_path)
 
-        # Save session
-        config.save_session("test.bsky.social", "test_session_string")
-        assert config.config_file.exists()
+    # Save session
+    config.save_session("test.bsky.social", "test_session_string")
+    assert config.config_file.exists()
 
-        # Clear session
-        config.clear_session()
-        assert not config.config_file.exists()
+    # Clear session
+    config.clear_session()
+    assert not config.config_file.exists()
 
 
-def test_load_config_empty():
+def test_load_config_empty(tmp_path: Path):
     """Test loading empty config."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
-        data = config.load_config()
-        assert data == {}
+    config = Config(config_dir=tmp_path)
+    data = config.load_config()
+    assert data == {}
 
 
-def test_save_and_load_session_with_custom_pds():
+def test_save_and_load_session_with_custom_pds(tmp_path: Path):
     """Test saving and loading session with custom PDS URL."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
+    config = Config(config_dir=tmp_path)
 
-        # Save session with custom PDS
-        config.save_session("test.custom.social", "test_session_string", "https://my-pds.com")
+    # Save session with custom PDS
+    config.save_session("test.custom.social", "test_session_string", "https://my-pds.com")
 
-        # Load session
-        handle, session, pds_url = config.load_session()
-        assert handle == "test.custom.social"
-        assert session == "test_session_string"
-        assert pds_url == "https://my-pds.com"
+    # Load session
+    handle, session, pds_url = config.load_session()
+    assert handle == "test.custom.social"
+    assert session == "test_session_string"
+    assert pds_url == "https://my-pds.com"
 
 
-def test_get_pds_url():
+def test_get_pds_url(tmp_path: Path):
     """Test getting PDS URL."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config = Config(config_dir=Path(tmpdir))
+    config = Config(config_dir=tmp_path)
 
-        # Default PDS URL when no config exists
-        assert config.get_pds_url() == "https://bsky.social"
+    # Default PDS URL when no config exists
+    assert config.get_pds_url() == "https://bsky.social"
 
-        # Save session with custom PDS
-        config.save_session("test.custom.social", "test_session_string", "https://my-pds.com")
+    # Save session with custom PDS
+    config.save_session("test.custom.social", "test_session_string", "https://my-pds.com")
 
-        # Get saved PDS URL
-        assert config.get_pds_url() == "https://my-pds.com"
+    # Get saved PDS URL
+    assert config.get_pds_url() == "https://my-pds.com"
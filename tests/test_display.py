@@ -1,12 +1,25 @@
 """Tests for display functions."""
 
-from unittest.mock import MagicMock
+from io import StringIO
+from types import SimpleNamespace
 
+import pytest
 from atproto_client.models.app.bsky.embed.images import View as ImagesView
+from atproto_client.models.app.bsky.embed.record import View as RecordView
 from atproto_client.models.app.bsky.embed.record_with_media import View as RecordWithMediaView
+from atproto_client.models.app.bsky.richtext.facet import ByteSlice, Mention
+from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
+from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
+from rich.console import Console
 from rich.text import Text
 
-from atpcli.display.bsky import _at_uri_to_web_url, _has_image, _render_text_with_links, display_feeds, display_post
+from atpcli.display.bsky import (
+    _at_uri_to_web_url,
+    _is_reply,
+    _render_text_with_links,
+    display_feeds,
+    display_post,
+)
 
 
 def test_at_uri_to_web_url():
@@ -111,18 +124,34 @@ def test_render_text_with_links_single_char_domain():
     assert link_found, "x.com should be styled as a link with https:// protocol"
 
 
-def test_display_post():
+def test_render_text_with_links_long_dotted_run():
+    """Test that a long dotted run with no TLD renders as plain text."""
+    text = "a." * 5000 + "1"
+    result = _render_text_with_links(text)
+    assert str(result) == text
+    assert result.spans == []
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [("Wow...example.com", "example.com"), ("--github.com/x", "github.com/x")],
+    ids=["after_ellipsis", "after_dashes"],
+)
+def test_render_text_with_links_after_punctuation(text, expected):
+    """Test that a domain directly after a run of dots or dashes is still linked."""
+    result = _render_text_with_links(text)
+    assert str(result) == text
+    assert len(result.spans) == 1
+    span = result.spans[0]
+    assert text[span.start : span.end] == expected
+    assert span.style.link == f"https://{expected}"
+
+
+def test_display_post(make_post):
     """Test displaying a post."""
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "This is a test post with https://example.com"
-    mock_post.record.reply = None
-    mock_post.like_count = 10
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    mock_post.embed = None
+    post = make_post("This is a test post with https://example.com", like_count=10)
 
-    table = display_post(mock_post)
+    table = display_post(post)
 
     # Check that the table has the correct title with link markup
     assert "Test User" in table.title
@@ -134,18 +163,11 @@ def test_display_post():
     assert "[/link]" in table.title
 
 
-def test_display_post_renders_content_links():
+def test_display_post_renders_content_links(make_post):
     """Test that URLs in post content are rendered as clickable links."""
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Check out https://example.com"
-    mock_post.record.reply = None
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    mock_post.embed = None
+    post = make_post("Check out https://example.com")
 
-    table = display_post(mock_post)
+    table = display_post(post)
 
     # The table should have at least one row
     assert len(table.rows) == 1
@@ -157,63 +179,25 @@ def test_display_post_renders_content_links():
     assert "https://example.com" in str(rendered)
 
 
-def test_has_image_no_embed():
-    """Test _has_image with no embed."""
-    mock_post = MagicMock()
-    mock_post.embed = None
-    assert _has_image(mock_post) is False
-
-
-def test_has_image_with_images_embed():
-    """Test _has_image with images embed."""
-    mock_post = MagicMock()
-    mock_post.embed = ImagesView(images=[])
-    assert _has_image(mock_post) is True
-
-
-def test_has_image_with_record_with_media():
-    """Test _has_image with record_with_media containing images."""
-    mock_post = MagicMock()
-    # Create a mock RecordWithMediaView with images media
-    mock_embed = MagicMock(spec=RecordWithMediaView)
-    mock_embed.media = ImagesView(images=[])
-    mock_post.embed = mock_embed
-    assert _has_image(mock_post) is True
-
-
-def test_has_image_with_non_image_embed():
-    """Test _has_image with non-image embed."""
-    mock_post = MagicMock()
-    # Mock a different embed type (not ImagesView or RecordWithMediaView)
-    mock_post.embed = MagicMock()
-    mock_post.embed.__class__ = type("OtherEmbed", (), {})
-    assert _has_image(mock_post) is False
-
-
-def test_display_post_with_image():
-    """Test displaying a post with an image shows the camera emoji."""
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Post with image"
-    mock_post.record.reply = None
-    mock_post.like_count = 10
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    mock_post.embed = ImagesView(images=[])
-
-    table = display_post(mock_post)
-
-    # Check that the title contains the camera emoji
-    assert "📷" in table.title
-    assert "Test User" in table.title
+@pytest.mark.parametrize(
+    ("embed", "badge"),
+    [
+        (None, ""),
+        (type("OtherEmbed", (), {})(), ""),
+        (ImagesView(images=[]), "📷 "),
+        (RecordView.model_construct(record=None), "🔁 "),
+        (RecordWithMediaView.model_construct(media=ImagesView(images=[]), record=None), "🔁 "),
+    ],
+    ids=["no_embed", "other_embed", "images", "record", "record_with_media"],
+)
+def test_display_post_embed_badge(make_post, embed, badge):
+    """Test the title badge chosen for each embed type, with quotes taking priority over images."""
+    table = display_post(make_post(embed=embed))
+    assert f"]{badge}Test User (@" in table.title
 
 
 def test_render_text_with_facets():
     """Test rendering text with facets for link detection."""
-    from atproto_client.models.app.bsky.richtext.facet import ByteSlice
-    from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
-    from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
-
     # Test text with a link containing special characters like !
     text = "Check out https://wagtail.org/blog/the-100! for more info"
 
@@ -245,12 +229,24 @@ def test_render_text_with_facets():
     assert link_found, "Full link with ! should be clickable"
 
 
+def test_render_text_with_mention_facets_only():
+    """Test that facets without links render as plain text and skip the URL regex."""
+    text = "Hello @alice.bsky.social, see example.com"
+    byte_start = text.index("@alice")
+    byte_end = byte_start + len("@alice.bsky.social")
+
+    facet = FacetMain(
+        index=ByteSlice(byte_start=byte_start, byte_end=byte_end),
+        features=[Mention(did="did:plc:alice")],
+    )
+
+    result = _render_text_with_links(text, facets=[facet])
+    assert str(result) == text
+    assert result.spans == []
+
+
 def test_render_text_with_multiple_facets():
     """Test rendering text with multiple link facets."""
-    from atproto_client.models.app.bsky.richtext.facet import ByteSlice
-    from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
-    from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
-
     text = "Visit https://example.com and https://test.org!"
 
     # Create facets for both links
@@ -288,12 +284,72 @@ def test_render_text_with_multiple_facets():
     assert any("link https://test.org!" in str(span.style) for span in result.spans)
 
 
+def test_render_text_with_overlapping_facets():
+    """Test that an overlapping link facet is skipped instead of duplicating text."""
+    text = "Read https://example.com/page today"
+    byte_start = text.index("https://")
+    byte_end = byte_start + len("https://example.com/page")
+
+    facets = [
+        FacetMain(
+            index=ByteSlice(byte_start=byte_start + 8, byte_end=byte_end),
+            features=[LinkFacet(uri="https://example.com/page")],
+        ),
+        FacetMain(
+            index=ByteSlice(byte_start=byte_start, byte_end=byte_end),
+            features=[LinkFacet(uri="https://example.com/page")],
+        ),
+    ]
+
+    result = _render_text_with_links(text, facets=facets)
+    assert str(result) == text
+    assert len(result.spans) == 1
+    assert result.spans[0].start == byte_start
+
+
+@pytest.mark.parametrize(
+    ("text", "byte_start", "byte_end"),
+    [
+        ("short text", 50, 60),
+        ("short text", 6, 3),
+        ("é short text", 50, 60),
+        ("é short text", 7, 4),
+    ],
+    ids=["ascii_out_of_range", "ascii_inverted", "unicode_out_of_range", "unicode_inverted"],
+)
+def test_render_text_with_malformed_facet(text, byte_start, byte_end):
+    """Test that a facet outside the text or with an inverted range is dropped and the text still prints."""
+    facet = FacetMain(
+        index=ByteSlice(byte_start=byte_start, byte_end=byte_end),
+        features=[LinkFacet(uri="https://example.com")],
+    )
+
+    result = _render_text_with_links(text, facets=[facet])
+    assert str(result) == text
+    assert result.spans == []
+
+    console = Console(file=StringIO(), width=80)
+    console.print(result)
+    assert text in console.file.getvalue()
+
+
+def test_render_text_with_unicode_after_inverted_facet():
+    """Test that an inverted facet does not shift the span of a later link in non-ASCII text."""
+    text = "é hello world foo bar baz"
+    facets = [
+        FacetMain(index=ByteSlice(byte_start=10, byte_end=5), features=[LinkFacet(uri="https://a.example")]),
+        FacetMain(index=ByteSlice(byte_start=12, byte_end=15), features=[LinkFacet(uri="https://b.example")]),
+    ]
+
+    result = _render_text_with_links(text, facets=facets)
+    assert len(result.spans) == 1
+    span = result.spans[0]
+    assert (span.start, span.end) == (11, 14)
+    assert text[span.start : span.end] == text.encode("utf-8")[12:15].decode("utf-8")
+
+
 def test_render_text_with_unicode_and_facets():
     """Test rendering text with unicode characters and facets."""
-    from atproto_client.models.app.bsky.richtext.facet import ByteSlice
-    from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
-    from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
-
     # Text with emoji (multi-byte character) before the link
     text = "🔥 Hot news: https://example.com/news"
 
@@ -317,21 +373,9 @@ def test_render_text_with_unicode_and_facets():
     assert any("link https://example.com/news" in str(span.style) for span in result.spans)
 
 
-def test_display_post_with_facets():
+def test_display_post_with_facets(make_post):
     """Test displaying a post with facets for proper link rendering."""
-    from atproto_client.models.app.bsky.richtext.facet import ByteSlice
-    from atproto_client.models.app.bsky.richtext.facet import Link as LinkFacet
-    from atproto_client.models.app.bsky.richtext.facet import Main as FacetMain
-
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
     text = "Check out https://wagtail.org/blog/the-100! for more"
-    mock_post.record.text = text
-    mock_post.record.reply = None
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    mock_post.embed = None
 
     # Create facet for the link with !
     link_start = text.index("https://wagtail.org/blog/the-100!")
@@ -343,9 +387,9 @@ def test_display_post_with_facets():
         index=ByteSlice(byte_start=byte_start, byte_end=byte_end),
         features=[LinkFacet(uri="https://wagtail.org/blog/the-100!")],
     )
-    mock_post.record.facets = [facet]
+    post = make_post(text, facets=[facet])
 
-    table = display_post(mock_post)
+    table = display_post(post)
 
     # The table should contain the full link with !
     assert len(table.rows) == 1
@@ -354,104 +398,27 @@ def test_display_post_with_facets():
     assert "https://wagtail.org/blog/the-100!" in str(rendered)
 
 
-def test_display_post_with_reply():
+def test_display_post_with_reply(make_post):
     """Test displaying a reply post shows the reply emoji."""
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "This is a reply"
-    # Create a mock reply object that isn't None
-    mock_post.record.reply = MagicMock()
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    mock_post.embed = None
-
-    table = display_post(mock_post)
+    # Any non-None reply reference marks the post as a reply
+    post = make_post("This is a reply", reply=SimpleNamespace(parent=None, root=None))
+
+    table = display_post(post)
 
     # Check that the title contains the reply emoji
     assert "⤴️" in table.title
     assert "Test User" in table.title
 
 
-def test_display_post_with_repost():
-    """Test displaying a repost/quote post shows the repost emoji."""
-    from atproto_client.models.app.bsky.embed.record import View as RecordView
-
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Quote posting this"
-    mock_post.record.reply = None
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    # Use isinstance check - create a proper RecordView instance
-    mock_post.embed = MagicMock(spec=RecordView)
-
-    table = display_post(mock_post)
-
-    # Check that the title contains the repost emoji
-    assert "🔁" in table.title
-    assert "Test User" in table.title
-
-
-def test_display_post_with_record_with_media():
-    """Test displaying a quote post with media shows the repost emoji."""
-    mock_post = MagicMock()
-    mock_post.author.display_name = "Test User"
-    mock_post.author.handle = "test.bsky.social"
-    mock_post.record.text = "Quote with image"
-    mock_post.record.reply = None
-    mock_post.like_count = 5
-    mock_post.uri = "at://did:plc:test123/app.bsky.feed.post/abc123"
-    # Create a mock RecordWithMediaView with images media
-    mock_embed = MagicMock(spec=RecordWithMediaView)
-    mock_embed.media = ImagesView(images=[])
-    mock_post.embed = mock_embed
-
-    table = display_post(mock_post)
-
-    # Check that the title contains the repost emoji (priority over image)
-    assert "🔁" in table.title
-    assert "Test User" in table.title
-
-
-def test_is_reply():
+def test_is_reply(make_post):
     """Test _is_reply function."""
-    from atpcli.display import _is_reply
-
     # Test with reply
-    mock_post = MagicMock()
-    mock_post.record.reply = MagicMock()  # Non-None reply object
-    assert _is_reply(mock_post) is True
+    post = make_post(reply=SimpleNamespace(parent=None, root=None))
+    assert _is_reply(post) is True
 
     # Test without reply
-    mock_post.record.reply = None
-    assert _is_reply(mock_post) is False
-
-
-def test_is_repost_or_quote():
-    """Test _is_repost_or_quote function."""
-    from atproto_client.models.app.bsky.embed.record import View as RecordView
-
-    from atpcli.display import _is_repost_or_quote
-
-    # Test with record embed
-    mock_post = MagicMock()
-    mock_post.embed = MagicMock(spec=RecordView)
-    assert _is_repost_or_quote(mock_post) is True
-
-    # Test with record with media
-    mock_embed = MagicMock(spec=RecordWithMediaView)
-    mock_post.embed = mock_embed
-    assert _is_repost_or_quote(mock_post) is True
-
-    # Test with no embed
-    mock_post.embed = None
-    assert _is_repost_or_quote(mock_post) is False
-
-    # Test with images embed
-    mock_post.embed = ImagesView(images=[])
-    assert _is_repost_or_quote(mock_post) is False
+    post.record.reply = None
+    assert _is_reply(post) is False
 
 
 def test_display_feeds():
@@ -465,35 +432,27 @@ def test_display_feeds():
         {
             "name": "Popular Feed",
             "uri": "at://did:plc:test/app.bsky.feed.generator/popular",
-            "description": "Popular posts",
+            "description": "",
         },
     ]
 
-    table = display_feeds(feed_details)
+    tables = display_feeds(feed_details)
 
-    # Check that table has the correct title
-    assert "Saved Feeds (2)" in table.title
+    # One table per feed, titled with the feed name
+    assert len(tables) == 2
+    assert tables[0].title == "Discover Feed"
+    assert tables[1].title == "Popular Feed"
 
-    # Check that table has correct number of columns
-    assert len(table.columns) == 3
+    # Each table has a single content column
+    for table in tables:
+        assert len(table.columns) == 1
+        assert table.columns[0].style == "white"
 
-    # Check column names and styles
-    assert table.columns[0].header == "Feed Name"
-    assert table.columns[0].style == "cyan"
-    assert table.columns[1].header == "URI"
-    assert table.columns[1].style == "dim white"
-    assert table.columns[2].header == "Description"
-    assert table.columns[2].style == "white"
+    # Description and URI rows, or just the URI when there is no description
+    assert tables[0].row_count == 2
+    assert tables[1].row_count == 1
 
 
 def test_display_feeds_empty():
     """Test display_feeds function with empty list."""
-    feed_details = []
-
-    table = display_feeds(feed_details)
-
-    # Check that table has the correct title
-    assert "Saved Feeds (0)" in table.title
-
-    # Table should have 3 columns even if empty
-    assert len(table.columns) == 3
+    assert display_feeds([]) == []
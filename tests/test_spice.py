@@ -1,18 +1,23 @@
 """Tests for Spice commands."""
 
-from unittest.mock import MagicMock, patch
+import json
+from types import SimpleNamespace
 
 import pytest
-from click.testing import CliRunner
+from atproto.exceptions import AtProtocolError
+from pydantic import field_validator
 
-from atpcli.cli import cli
-from atpcli.spice import parse_at_uri
+from atpcli import spice as spice_module
+from atpcli.models import SpiceNote
+from atpcli.spice import add, add_bulk, delete, parse_at_uri, spice
+from atpcli.spice import list as list_notes
 
 
-@pytest.fixture
-def runner():
-    """Create a CLI runner."""
-    return CliRunner()
+class ListRecordsResponse(SimpleNamespace):
+    """listRecords response fake supporting both attribute and item access, like atproto models."""
+
+    def __getitem__(self, key):
+        return getattr(self, key)
 
 
 def test_parse_at_uri_valid():
@@ -29,130 +34,117 @@ def test_parse_at_uri_invalid_no_scheme():
         parse_at_uri("did:plc:test123/tools.spice.note/abc123")
 
 
-def test_parse_at_uri_invalid_format():
+@pytest.mark.parametrize(
+    "at_uri",
+    ["at://invalid", "at://did:plc:test123//abc123", "at://did:plc:test123/tools.spice.note/abc123/extra"],
+    ids=["too_few_parts", "empty_part", "too_many_parts"],
+)
+def test_parse_at_uri_invalid_format(at_uri):
     """Test parsing AT URI with invalid format."""
     with pytest.raises(ValueError, match="Invalid AT URI format"):
-        parse_at_uri("at://invalid")
+        parse_at_uri(at_uri)
 
 
-def test_spice_group(runner):
+def test_spice_group(invoke_ok):
     """Test that spice group runs."""
-    result = runner.invoke(cli, ["spice", "--help"])
+    result = invoke_ok(spice, ["--help"])
     assert result.exit_code == 0
     assert "Spice" in result.output
     assert "web annotations" in result.output
 
 
-def test_add_command_help(runner):
+def test_add_command_help(invoke_ok):
     """Test add command help."""
-    result = runner.invoke(cli, ["spice", "add", "--help"])
+    result = invoke_ok(add, ["--help"])
     assert result.exit_code == 0
     assert "Add a new note to a URL" in result.output
 
 
-def test_list_command_help(runner):
+def test_list_command_help(invoke_ok):
     """Test list command help."""
-    result = runner.invoke(cli, ["spice", "list", "--help"])
+    result = invoke_ok(list_notes, ["--help"])
     assert result.exit_code == 0
     assert "List your notes" in result.output
 
 
-def test_delete_command_help(runner):
+def test_delete_command_help(invoke_ok):
     """Test delete command help."""
-    result = runner.invoke(cli, ["spice", "delete", "--help"])
+    result = invoke_ok(delete, ["--help"])
     assert result.exit_code == 0
     assert "Delete a note by its AT URI" in result.output
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_add_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test add when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "add", "https://example.com", "Test note"])
+@pytest.mark.parametrize(
+    ("command", "args"),
+    [
+        (add, ["https://example.com", "Test note"]),
+        (list_notes, ["https://example.com"]),
+        (delete, ["at://did:plc:test123/tools.spice.note/abc123"]),
+    ],
+    ids=["add", "list", "delete"],
+)
+@pytest.mark.usefixtures("spice_not_logged_in")
+def test_not_logged_in(runner, command, args):
+    """Test that every spice command refuses to run when not logged in."""
+    result = runner.invoke(command, args)
 
     assert result.exit_code == 1
     assert "Not logged in" in result.output
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_add_invalid_url_no_scheme(mock_config_class, mock_create_client, runner):
-    """Test add with invalid URL (no scheme)."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "add", "example.com", "Test note"])
-
-    assert result.exit_code == 1
-    assert "Invalid URL" in result.output
-
-
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_add_empty_text(mock_config_class, mock_create_client, runner):
-    """Test add with empty text."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "add", "https://example.com", ""])
-
-    assert result.exit_code == 1
-    assert "Text cannot be empty" in result.output
-
-
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_add_text_too_long(mock_config_class, mock_create_client, runner):
-    """Test add with text exceeding max length."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    # Create text longer than 256 characters
-    long_text = "x" * 257
-
-    result = runner.invoke(cli, ["spice", "add", "https://example.com", long_text])
+@pytest.mark.parametrize(
+    ("command", "args", "expected"),
+    [
+        (add, ["example.com", "Test note"], "Invalid URL"),
+        (add, ["https:///page", "Test note"], "Invalid URL"),
+        (add, ["https://?q=1", "Test note"], "Invalid URL"),
+        (add, ["https://#frag", "Test note"], "Invalid URL"),
+        (add, ["https://example.com", ""], "Text cannot be empty"),
+        (add, ["https://example.com", "x" * 257], "Text is too long: 257 characters"),
+        (delete, ["did:plc:test123/tools.spice.note/abc123"], "AT URI must start with 'at://'"),
+        (delete, ["at://invalid"], "Invalid AT URI format"),
+        (delete, ["at://did:plc:test123/app.bsky.feed.post/abc123"], "Invalid collection"),
+    ],
+    ids=[
+        "add_url_no_scheme",
+        "add_url_no_host",
+        "add_url_query_no_host",
+        "add_url_fragment_no_host",
+        "add_empty_text",
+        "add_text_too_long",
+        "delete_uri_no_scheme",
+        "delete_uri_format",
+        "delete_wrong_collection",
+    ],
+)
+@pytest.mark.usefixtures("spice_logged_in")
+def test_invalid_input(spice_mocks, runner, command, args, expected):
+    """Test that invalid arguments are rejected before any client is created."""
+    result = runner.invoke(command, args)
 
     assert result.exit_code == 1
-    assert "Text is too long" in result.output
-    assert "257 characters" in result.output
+    assert expected in result.output
+    spice_mocks.create_client.assert_not_called()
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_add_success(mock_config_class, mock_create_client, runner):
+def test_add_success(spice_client, spice_mocks, invoke_ok):
     """Test successful note creation."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.me.did = "did:plc:test123"
-
     # Mock create_record response
-    mock_response = MagicMock()
-    mock_response.uri = "at://did:plc:test123/tools.spice.note/abc123xyz"
-    mock_client.com.atproto.repo.create_record.return_value = mock_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
+    mock_response = SimpleNamespace(uri="at://did:plc:test123/tools.spice.note/abc123xyz")
+    spice_client.com.atproto.repo.create_record.return_value = mock_response
 
     # Run add
-    result = runner.invoke(cli, ["spice", "add", "https://example.com/page", "Great article!"])
+    result = invoke_ok(add, ["https://example.com/page", "Great article!"])
 
     # Verify
     assert result.exit_code == 0
     assert "Created: at://did:plc:test123/tools.spice.note/abc123xyz" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
+    spice_mocks.create_client.assert_called_once_with(
+        spice_mocks.config, "test.bsky.social", "test_session", "https://bsky.social"
+    )
 
     # Verify create_record was called with correct parameters
-    call_args = mock_client.com.atproto.repo.create_record.call_args
+    call_args = spice_client.com.atproto.repo.create_record.call_args
     assert call_args is not None
     record_data = call_args[0][0]
     assert record_data["repo"] == "did:plc:test123"
@@ -162,96 +154,143 @@ def test_add_success(mock_config_class, mock_create_client, runner):
     assert "createdAt" in record_data["record"]
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_list_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test list when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
+def test_add_protocol_error(spice_client, runner):
+    """Test add reports AT Protocol errors without a traceback."""
+    spice_client.com.atproto.repo.create_record.side_effect = AtProtocolError("Record rejected")
 
-    result = runner.invoke(cli, ["spice", "list", "https://example.com"])
+    result = runner.invoke(add, ["https://example.com", "Test note"])
 
     assert result.exit_code == 1
-    assert "Not logged in" in result.output
+    assert "Failed to create note: Record rejected" in result.output
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_list_no_notes(mock_config_class, mock_create_client, runner):
-    """Test list with no matching notes."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.me.did = "did:plc:test123"
+def test_add_unexpected_error_propagates(spice_client, runner):
+    """Test add lets unexpected errors propagate so the traceback is not lost."""
+    spice_client.com.atproto.repo.create_record.side_effect = RuntimeError("boom")
 
-    # Mock list_records response with no records
-    mock_response = MagicMock()
-    mock_response.records = []
-    mock_response.__getitem__ = lambda self, key: getattr(self, key)
-    mock_client.com.atproto.repo.list_records.return_value = mock_response
+    with pytest.raises(RuntimeError, match="boom"):
+        runner.invoke(add, ["https://example.com", "Test note"], catch_exceptions=False)
+
+
+def test_add_bulk_command_help(invoke_ok):
+    """Test add-bulk command help."""
+    result = invoke_ok(add_bulk, ["--help"])
+    assert result.exit_code == 0
+    assert "Add many notes at once" in result.output
+
+
+@pytest.mark.usefixtures("spice_logged_in")
+def test_add_bulk_invalid_line(spice_mocks, runner):
+    """Test add-bulk rejects the file before any network call when a line is invalid."""
+    lines = [
+        json.dumps({"url": "https://example.com", "text": "Fine"}),
+        json.dumps({"url": "example.com", "text": "No scheme"}),
+    ]
+    result = runner.invoke(add_bulk, ["-"], input="\n".join(lines))
+
+    assert result.exit_code == 1
+    assert "Line 2" in result.output
+    spice_mocks.create_client.assert_not_called()
+
+
+@pytest.mark.usefixtures("spice_logged_in")
+def test_add_bulk_invalid_line_escapes_markup(monkeypatch, runner):
+    """Test add-bulk prints validation messages containing square brackets literally."""
+
+    class BracketNote(SpiceNote):
+        @field_validator("text")
+        @classmethod
+        def reject_text(cls, v: str) -> str:
+            raise ValueError("text [/red] is not allowed")
+
+    monkeypatch.setattr(spice_module, "SpiceNote", BracketNote)
+    result = runner.invoke(add_bulk, ["-"], input=json.dumps({"url": "https://example.com", "text": "Hi"}))
+
+    assert result.exit_code == 1
+    assert "Line 1: text: Value error, text [/red] is not allowed" in result.output
+
+
+def test_add_bulk_success(spice_client, invoke_ok):
+    """Test add-bulk batches writes into applyWrites calls of at most 200 records."""
+
+    def apply_writes(data):
+        return SimpleNamespace(
+            results=[
+                SimpleNamespace(uri=f"at://did:plc:test123/tools.spice.note/{i}") for i in range(len(data["writes"]))
+            ]
+        )
+
+    spice_client.com.atproto.repo.apply_writes.side_effect = apply_writes
 
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
+    lines = [json.dumps({"url": f"https://example.com/{i}", "text": f"Note {i}"}) for i in range(201)]
+    result = invoke_ok(add_bulk, ["-"], input="\n".join(lines) + "\n")
+
+    assert result.exit_code == 0
+    assert "Creating 201 note(s)" in result.output
+    assert result.output.count("Created: at://") == 201
+
+    calls = spice_client.com.atproto.repo.apply_writes.call_args_list
+    assert [len(call[0][0]["writes"]) for call in calls] == [200, 1]
+    write = calls[1][0][0]["writes"][0]
+    assert calls[1][0][0]["repo"] == "did:plc:test123"
+    assert write["$type"] == "com.atproto.repo.applyWrites#create"
+    assert write["collection"] == "tools.spice.note"
+    assert write["value"]["url"] == "https://example.com/200"
+    assert write["value"]["text"] == "Note 200"
+
+
+def test_list_no_notes(spice_client, spice_mocks, invoke_ok):
+    """Test list with no matching notes."""
+    # Mock list_records response with no records
+    mock_response = ListRecordsResponse(records=[])
+    spice_client.com.atproto.repo.list_records.return_value = mock_response
 
     # Run list
-    result = runner.invoke(cli, ["spice", "list", "https://example.com"])
+    result = invoke_ok(list_notes, ["https://example.com"])
 
     # Verify
     assert result.exit_code == 0
     assert "No notes found" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
+    spice_mocks.create_client.assert_called_once_with(
+        spice_mocks.config, "test.bsky.social", "test_session", "https://bsky.social"
+    )
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_list_success(mock_config_class, mock_create_client, runner):
+def test_list_success(spice_client, spice_mocks, invoke_ok):
     """Test successful note listing."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.me.did = "did:plc:test123"
-
     # Mock list_records response
-    mock_record1 = MagicMock()
-    mock_record1.uri = "at://did:plc:test123/tools.spice.note/abc123"
-    mock_record1.value = {
-        "url": "https://example.com",
-        "text": "First note",
-        "createdAt": "2026-02-21T10:00:00Z",
-    }
-
-    mock_record2 = MagicMock()
-    mock_record2.uri = "at://did:plc:test123/tools.spice.note/xyz789"
-    mock_record2.value = {
-        "url": "https://different.com",
-        "text": "Different URL",
-        "createdAt": "2026-02-21T11:00:00Z",
-    }
-
-    mock_record3 = MagicMock()
-    mock_record3.uri = "at://did:plc:test123/tools.spice.note/def456"
-    mock_record3.value = {
-        "url": "https://example.com",
-        "text": "Second note",
-        "createdAt": "2026-02-21T12:00:00Z",
-    }
-
-    mock_response = MagicMock()
-    mock_response.records = [mock_record1, mock_record2, mock_record3]
-    mock_response.cursor = None
-    mock_response.__getitem__ = lambda self, key: getattr(self, key)
-    mock_client.com.atproto.repo.list_records.return_value = mock_response
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
+    mock_record1 = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/abc123",
+        value={
+            "url": "https://example.com",
+            "text": "First note",
+            "createdAt": "2026-02-21T10:00:00Z",
+        },
+    )
+
+    mock_record2 = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/xyz789",
+        value={
+            "url": "https://different.com",
+            "text": "Different URL",
+            "createdAt": "2026-02-21T11:00:00Z",
+        },
+    )
+
+    mock_record3 = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/def456",
+        value={
+            "url": "https://example.com",
+            "text": "Second note",
+            "createdAt": "2026-02-21T12:00:00Z",
+        },
+    )
+
+    mock_response = ListRecordsResponse(records=[mock_record1, mock_record2, mock_record3], cursor=None)
+    spice_client.com.atproto.repo.list_records.return_value = mock_response
 
     # Run list
-    result = runner.invoke(cli, ["spice", "list", "https://example.com"])
+    result = invoke_ok(list_notes, ["https://example.com"])
 
     # Verify - should only show records for https://example.com
     # After reverse, oldest appears first so latest appears at bottom when scrolling
@@ -265,151 +304,143 @@ def test_list_success(mock_config_class, mock_create_client, runner):
     first_note_pos = result.output.index("First note")
     second_note_pos = result.output.index("Second note")
     assert second_note_pos < first_note_pos  # Second (newer) appears before First (older)
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
+    spice_mocks.create_client.assert_called_once_with(
+        spice_mocks.config, "test.bsky.social", "test_session", "https://bsky.social"
+    )
+
+
+def test_list_skips_invalid_records(spice_client, invoke_ok):
+    """Test list warns about and skips stored records that are not valid notes."""
+    records = [
+        SimpleNamespace(
+            uri="at://did:plc:test123/tools.spice.note/abc123",
+            value={"url": "https://example.com", "text": "Valid note", "createdAt": "2026-02-21T10:00:00Z"},
+        ),
+        SimpleNamespace(
+            uri="at://did:plc:test123/tools.spice.note/offset",
+            value={"url": "https://example.com", "text": "Local time", "createdAt": "2026-02-21T10:00:00+01:00"},
+        ),
+        SimpleNamespace(
+            uri="at://did:plc:test123/tools.spice.note/nokey",
+            value={"url": "https://example.com", "text": "No timestamp"},
+        ),
+    ]
+    spice_client.com.atproto.repo.list_records.return_value = ListRecordsResponse(records=records, cursor=None)
+
+    result = invoke_ok(list_notes, ["https://example.com"])
+
+    assert result.exit_code == 0
+    assert "Found 1 note(s)" in result.output
+    assert "Valid note" in result.output
+    assert "Skipping invalid note at://did:plc:test123/tools.spice.note/offset" in result.output
+    assert "Skipping invalid note at://did:plc:test123/tools.spice.note/nokey" in result.output
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_list_with_pagination(mock_config_class, mock_create_client, runner):
+def test_list_with_pagination(spice_client, spice_mocks, invoke_ok):
     """Test list with pagination."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.me.did = "did:plc:test123"
-
     # Mock first page
-    mock_record1 = MagicMock()
-    mock_record1.uri = "at://did:plc:test123/tools.spice.note/abc123"
-    mock_record1.value = {
-        "url": "https://example.com",
-        "text": "First note",
-        "createdAt": "2026-02-21T10:00:00Z",
-    }
-
-    mock_response1 = MagicMock()
-    mock_response1.records = [mock_record1]
-    mock_response1.cursor = "cursor_page_2"
-    mock_response1.__getitem__ = lambda self, key: getattr(self, key)
+    mock_record1 = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/abc123",
+        value={
+            "url": "https://example.com",
+            "text": "First note",
+            "createdAt": "2026-02-21T10:00:00Z",
+        },
+    )
+
+    mock_response1 = ListRecordsResponse(records=[mock_record1], cursor="cursor_page_2")
 
     # Mock second page
-    mock_record2 = MagicMock()
-    mock_record2.uri = "at://did:plc:test123/tools.spice.note/def456"
-    mock_record2.value = {
-        "url": "https://example.com",
-        "text": "Second note",
-        "createdAt": "2026-02-21T12:00:00Z",
-    }
-
-    mock_response2 = MagicMock()
-    mock_response2.records = [mock_record2]
-    mock_response2.cursor = None
-    mock_response2.__getitem__ = lambda self, key: getattr(self, key)
+    mock_record2 = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/def456",
+        value={
+            "url": "https://example.com",
+            "text": "Second note",
+            "createdAt": "2026-02-21T12:00:00Z",
+        },
+    )
 
-    # Mock list_records to return different responses for pagination
-    mock_client.com.atproto.repo.list_records.side_effect = [mock_response1, mock_response2]
+    mock_response2 = ListRecordsResponse(records=[mock_record2], cursor=None)
 
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
+    # Mock list_records to return different responses for pagination
+    spice_client.com.atproto.repo.list_records.side_effect = [mock_response1, mock_response2]
 
     # Run list with --all flag
-    result = runner.invoke(cli, ["spice", "list", "https://example.com", "--all"])
+    result = invoke_ok(list_notes, ["https://example.com", "--all"])
 
     # Verify
     assert result.exit_code == 0
     assert "Found 2 note(s)" in result.output
     assert "First note" in result.output
     assert "Second note" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
+    spice_mocks.create_client.assert_called_once_with(
+        spice_mocks.config, "test.bsky.social", "test_session", "https://bsky.social"
+    )
     # Should be called twice for pagination
-    assert mock_client.com.atproto.repo.list_records.call_count == 2
+    assert spice_client.com.atproto.repo.list_records.call_count == 2
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_delete_not_logged_in(mock_config_class, mock_create_client, runner):
-    """Test delete when not logged in."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = (None, None, "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "delete", "at://did:plc:test123/tools.spice.note/abc123"])
-
-    assert result.exit_code == 1
-    assert "Not logged in" in result.output
+def test_list_all_notes_with_limit_requests_only_limit(spice_client, invoke_ok):
+    """Test that listing without a URL filter only requests as many records as will be shown."""
+    mock_record = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/abc123",
+        value={"url": "https://example.com", "text": "First note", "createdAt": "2026-02-21T10:00:00Z"},
+    )
+    spice_client.com.atproto.repo.list_records.return_value = ListRecordsResponse(records=[mock_record], cursor=None)
 
+    result = invoke_ok(list_notes, ["--limit", "1"])
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_delete_invalid_uri_no_scheme(mock_config_class, mock_create_client, runner):
-    """Test delete with invalid AT URI (no at:// scheme)."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "delete", "did:plc:test123/tools.spice.note/abc123"])
-
-    assert result.exit_code == 1
-    assert "AT URI must start with 'at://'" in result.output
-
-
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_delete_invalid_uri_format(mock_config_class, mock_create_client, runner):
-    """Test delete with invalid AT URI format."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "delete", "at://invalid"])
-
-    assert result.exit_code == 1
-    assert "Invalid AT URI format" in result.output
-
-
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_delete_wrong_collection(mock_config_class, mock_create_client, runner):
-    """Test delete with wrong collection type."""
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
-
-    result = runner.invoke(cli, ["spice", "delete", "at://did:plc:test123/app.bsky.feed.post/abc123"])
+    assert result.exit_code == 0
+    assert "Found 1 note(s)" in result.output
+    params = spice_client.com.atproto.repo.list_records.call_args[0][0]
+    assert params["limit"] == 1
+
+
+def test_list_with_limit_pages_past_invalid_records(spice_client, invoke_ok):
+    """Test that --limit keeps paging when skipped records leave a page short of the limit."""
+    invalid_record = SimpleNamespace(
+        uri="at://did:plc:test123/tools.spice.note/invalid",
+        value={"url": "https://example.com", "text": "No timestamp"},
+    )
+    valid_records = [
+        SimpleNamespace(
+            uri=f"at://did:plc:test123/tools.spice.note/note{i}",
+            value={"url": "https://example.com", "text": f"Note {i}", "createdAt": "2026-02-21T10:00:00Z"},
+        )
+        for i in range(2)
+    ]
+    spice_client.com.atproto.repo.list_records.side_effect = [
+        ListRecordsResponse(records=[invalid_record, valid_records[0]], cursor="cursor_page_2"),
+        ListRecordsResponse(records=[valid_records[1]], cursor="cursor_page_3"),
+    ]
+
+    result = invoke_ok(list_notes, ["--limit", "2"])
 
-    assert result.exit_code == 1
-    assert "Invalid collection" in result.output
+    assert result.exit_code == 0
+    assert "Found 2 note(s)" in result.output
+    calls = spice_client.com.atproto.repo.list_records.call_args_list
+    assert [call[0][0]["limit"] for call in calls] == [2, 1]
+    assert calls[1][0][0]["cursor"] == "cursor_page_2"
 
 
-@patch("atpcli.spice.create_client_with_session_refresh")
-@patch("atpcli.spice.Config")
-def test_delete_success(mock_config_class, mock_create_client, runner):
+def test_delete_success(spice_client, spice_mocks, invoke_ok):
     """Test successful note deletion."""
-    # Setup mocks
-    mock_client = MagicMock()
-    mock_create_client.return_value = mock_client
-    mock_client.me.did = "did:plc:test123"
-
     # Mock delete_record (it returns None on success)
-    mock_client.com.atproto.repo.delete_record.return_value = None
-
-    # Mock config
-    mock_config = MagicMock()
-    mock_config.load_session.return_value = ("test.bsky.social", "test_session", "https://bsky.social")
-    mock_config_class.return_value = mock_config
+    spice_client.com.atproto.repo.delete_record.return_value = None
 
     # Run delete
     at_uri = "at://did:plc:test123/tools.spice.note/abc123xyz"
-    result = runner.invoke(cli, ["spice", "delete", at_uri])
+    result = invoke_ok(delete, [at_uri])
 
     # Verify
     assert result.exit_code == 0
     assert f"Deleted: {at_uri}" in result.output
-    mock_create_client.assert_called_once_with(mock_config, "test.bsky.social", "test_session", "https://bsky.social")
+    spice_mocks.create_client.assert_called_once_with(
+        spice_mocks.config, "test.bsky.social", "test_session", "https://bsky.social"
+    )
 
     # Verify delete_record was called with correct parameters
-    call_args = mock_client.com.atproto.repo.delete_record.call_args
+    call_args = spice_client.com.atproto.repo.delete_record.call_args
     assert call_args is not None
     delete_data = call_args[0][0]
     assert delete_data["repo"] == "did:plc:test123"